@@ -126,6 +126,9 @@ ICD10_CM_ZIP_URL: str | None = os.environ.get("ICD10_CM_ZIP_URL") or None
 # Download timeout (seconds; must be > 0)
 DOWNLOAD_TIMEOUT = _safe_float_positive("DOWNLOAD_TIMEOUT", 60.0)
 
+# Worker processes for PDF/HTML text extraction, auto and IOM (>= 1; 1 extracts serially in-process)
+EXTRACT_WORKERS = _safe_positive_int("EXTRACT_WORKERS", os.cpu_count() or 1)
+
 # MCD CSV max field size (bytes; must be >= 1). Very large policy/narrative fields may exceed
 # Python's default; set high enough for real exports but bounded to limit blast radius.
 CSV_FIELD_SIZE_LIMIT = _safe_positive_int("CSV_FIELD_SIZE_LIMIT", 10 * 1024 * 1024)
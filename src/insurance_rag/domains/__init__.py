@@ -1,45 +1,69 @@
 """Insurance domain registry.
 
 Domains register themselves via the :func:`register_domain` decorator.
-Use :func:`get_domain` to instantiate a registered domain by name.
+Built-in domains are listed by dotted path and only imported the first
+time they are requested. Use :func:`get_domain` to get a registered
+domain by name.
 """
 from __future__ import annotations
 
+import importlib
+import logging
+
 from insurance_rag.domains.base import InsuranceDomain
 
+logger = logging.getLogger(__name__)
+
+# Built-in domains as "module:ClassName"; imported on first get_domain().
+_BUILTIN_DOMAINS: dict[str, str] = {
+    "medicare": "insurance_rag.domains.medicare:MedicareDomain",
+    "auto": "insurance_rag.domains.auto:AutoInsuranceDomain",
+}
+
 _REGISTRY: dict[str, type[InsuranceDomain]] = {}
+_LOADED: dict[str, InsuranceDomain] = {}
 
 
 def register_domain(cls: type[InsuranceDomain]) -> type[InsuranceDomain]:
     """Class decorator that registers a domain plugin."""
     instance = cls()
     _REGISTRY[instance.name] = cls
+    _LOADED.pop(instance.name, None)
     return cls
 
 
 def get_domain(name: str) -> InsuranceDomain:
-    """Return an instance of the named domain. Raises KeyError if unknown."""
-    if name not in _REGISTRY:
-        _discover_domains()
+    """Return the named domain instance (created once). Raises KeyError if unknown."""
+    domain = _LOADED.get(name)
+    if domain is not None:
+        return domain
+    if name not in _REGISTRY and name in _BUILTIN_DOMAINS:
+        _import_builtin(name)
     if name not in _REGISTRY:
         raise KeyError(
-            f"Unknown domain {name!r}. Available: {', '.join(sorted(_REGISTRY))}."
+            f"Unknown domain {name!r}. Available: {', '.join(list_domains())}."
         )
-    return _REGISTRY[name]()
+    domain = _LOADED[name] = _REGISTRY[name]()
+    return domain
 
 
 def list_domains() -> list[str]:
-    """Return sorted list of registered domain names."""
-    _discover_domains()
-    return sorted(_REGISTRY)
+    """Return sorted list of registered domain names (without importing them)."""
+    return sorted(_REGISTRY.keys() | _BUILTIN_DOMAINS.keys())
 
 
-def _discover_domains() -> None:
-    """Import built-in domain packages so they self-register."""
-    import importlib
+def _import_builtin(name: str) -> None:
+    """Import a built-in domain package so it self-registers.
 
-    for mod_name in ("insurance_rag.domains.medicare", "insurance_rag.domains.auto"):
-        try:
-            importlib.import_module(mod_name)
-        except ImportError:
-            pass
+    An import failure is logged and leaves the domain unregistered, so
+    :func:`get_domain` reports it as unknown.
+    """
+    module_name, _, class_name = _BUILTIN_DOMAINS[name].partition(":")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        logger.warning("Could not import built-in domain %r from %s: %s", name, module_name, e)
+        return
+    cls = getattr(module, class_name, None)
+    if cls is not None and name not in _REGISTRY:
+        _REGISTRY[name] = cls
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -72,6 +73,11 @@ class AutoInsuranceDomain(InsuranceDomain):
         return Path(__file__).parent / "data" / "topics.json"
 
     def get_query_patterns(self) -> dict[str, Any]:
+        return self.query_patterns
+
+    @cached_property
+    def query_patterns(self) -> dict[str, Any]:
+        """Query patterns dict, built once per instance. Callers must not mutate it."""
         from insurance_rag.domains.auto.patterns import (
             COVERAGE_QUERY_PATTERNS,
             COVERAGE_TOPIC_PATTERNS,
@@ -1,17 +1,37 @@
-"""Auto insurance data downloaders: NAIC model laws, state consumer guides, claims, rates."""
+"""Auto insurance data downloaders: NAIC model laws, state consumer guides, claims, rates.
+
+Each ``download_*`` accepts an optional ``transport`` (an ``httpx.AsyncBaseTransport``,
+e.g. ``httpx.MockTransport`` in tests); the ``httpx.AsyncClient`` itself is always
+created on the loop that runs the fetches and closed when they finish.
+The functions are synchronous and can also be called from inside a running event
+loop (a notebook, an async caller): the fetches then run on a private loop in a
+worker thread.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
 import logging
+import os
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import httpx
 
-from insurance_rag.download._manifest import file_sha256, write_manifest
+from insurance_rag.download._manifest import (
+    file_sha256,
+    manifest_matches,
+    read_manifest,
+    write_manifest,
+)
 from insurance_rag.download._utils import (
     DOWNLOAD_TIMEOUT,
+    astream_download,
     sanitize_filename_from_url,
-    stream_download,
 )
 
 logger = logging.getLogger(__name__)
@@ -72,26 +92,37 @@ RATES_URLS: dict[str, str] = {
 }
 
 
-def _download_url_to_file(
-    client: httpx.Client,
-    url: str,
-    dest: Path,
-    *,
-    force: bool,
-    binary: bool = True,
-) -> bool:
-    """Download url to dest. Return True if downloaded or already present, False on 404/skip."""
-    if dest.exists() and not force:
-        logger.debug("Skipping (exists): %s", dest)
-        return True
+# Max in-flight requests per download_* call; URLs within a category are independent.
+DOWNLOAD_CONCURRENCY = 8
+
+
+# HTTP/2 lets same-host downloads multiplex over one connection; httpx needs h2
+# for it (``pip install -e ".[http2]"``), otherwise keep-alive HTTP/1.1 is used.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _async_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=DOWNLOAD_TIMEOUT,
+        follow_redirects=True,
+        headers=DOWNLOAD_HEADERS,
+        http2=_HTTP2,
+        limits=httpx.Limits(
+            max_connections=16, max_keepalive_connections=16, keepalive_expiry=60
+        ),
+    )
+
+
+async def _fetch_one(client: httpx.AsyncClient, url: str, dest: Path) -> bool:
+    """Download url to dest. Return True if downloaded, False on 404/skip.
+
+    PDFs and HTML pages alike are streamed to disk as raw bytes; HTML is not
+    decoded here (the extractor detects its encoding).
+    """
+    logger.info("Downloading %s -> %s", url, dest)
     try:
-        if binary:
-            stream_download(client, url, dest)
-        else:
-            resp = client.get(url)
-            resp.raise_for_status()
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(resp.text, encoding="utf-8", errors="replace")
+        await astream_download(client, url, dest)
         return True
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
@@ -106,191 +137,258 @@ def _download_url_to_file(
         raise
 
 
-def download_regulations(raw_dir: Path, *, force: bool = False) -> None:
+async def _fetch_all(
+    jobs: list[tuple[str, Path]], transport: httpx.AsyncBaseTransport | None = None
+) -> list[bool]:
+    """Fetch ``(url, dest)`` jobs concurrently; results are in job order.
+
+    If any fetch fails, the rest are cancelled and the error propagates.
+    The client is built here, so its connections belong to the running loop.
+    """
+    sem = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+
+    async with _async_client(transport) as client:
+
+        async def bounded(url: str, dest: Path) -> bool:
+            async with sem:
+                return await _fetch_one(client, url, dest)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(bounded(url, dest)) for url, dest in jobs]
+    return [task.result() for task in tasks]
+
+
+def _run(coro: Coroutine[Any, Any, list[bool]]) -> list[bool]:
+    """Run coro to completion from synchronous code.
+
+    asyncio.run refuses to start while a loop is already running in this thread,
+    so in that case the coroutine gets its own loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()
+
+
+def _existing_files(dirs: set[Path]) -> set[Path]:
+    """Return the regular files in dirs, listing each directory once."""
+    found: set[Path] = set()
+    for d in dirs:
+        try:
+            with os.scandir(d) as it:
+                found.update(d / entry.name for entry in it if entry.is_file())
+        except FileNotFoundError:
+            continue
+    return found
+
+
+def _download_all(
+    jobs: list[tuple[str, Path]],
+    *,
+    force: bool,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> tuple[list[tuple[Path, str | None]], bool]:
+    """Download jobs whose dest is missing (or all, if force), then hash the files
+    that are present (in job order, on a thread pool).
+
+    Returns the (path, hash) pairs and whether any file was fetched.
+    """
+    present = set() if force else _existing_files({dest.parent for _, dest in jobs})
+    pending = [job for job in jobs if job[1] not in present]
+    for _, dest in jobs:
+        if dest in present:
+            logger.debug("Skipping (exists): %s", dest)
+    fetched: dict[Path, bool] = {}
+    if pending:
+        results = _run(_fetch_all(pending, transport))
+        fetched = {dest: ok for (_, dest), ok in zip(pending, results, strict=True)}
+
+    files = [dest for _, dest in jobs if dest in present or fetched.get(dest)]
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_CONCURRENCY, len(files))) as ex:
+            hashes = list(ex.map(_sha256_or_none, files))
+    else:
+        hashes = [_sha256_or_none(f) for f in files]
+    return list(zip(files, hashes, strict=True)), any(fetched.values())
+
+
+def _urlset_fingerprint(urls: dict[str, str]) -> str:
+    """Stable hash of a category's key=url pairs, recorded in its manifest."""
+    joined = "\n".join(sorted(f"{k}={v}" for k, v in urls.items()))
+    return hashlib.sha256(joined.encode()).hexdigest()
+
+
+def _manifest_is_current(
+    manifest_path: Path, fingerprint: str, jobs: list[tuple[str, Path]]
+) -> bool:
+    """True if the manifest was written for this exact URL set, lists every
+    job's file, and those files are all still on disk."""
+    manifest = read_manifest(manifest_path)
+    if manifest is None or manifest.get("urlset_hash") != fingerprint:
+        return False
+    base = manifest_path.parent
+    recorded = {entry.get("path") for entry in manifest.get("files") or []}
+    if recorded != {str(dest.relative_to(base)) for _, dest in jobs}:
+        return False
+    present = _existing_files({dest.parent for _, dest in jobs})
+    return all(dest in present for _, dest in jobs)
+
+
+def _download_category(
+    jobs: list[tuple[str, Path]],
+    manifest_path: Path,
+    source_url: str,
+    urls: dict[str, str],
+    *,
+    force: bool,
+    transport: httpx.AsyncBaseTransport | None,
+) -> None:
+    """Download one category's jobs and write its manifest.
+
+    When not forcing and the manifest already covers this URL set with every
+    file present, returns without re-hashing files or touching the manifest.
+    If nothing was fetched and the manifest already records the same files and
+    hashes, it is left as is, keeping the download_date of the last fetch.
+    """
+    fingerprint = _urlset_fingerprint(urls)
+    if not force and _manifest_is_current(manifest_path, fingerprint, jobs):
+        logger.info("Up to date (all %d files present): %s", len(jobs), manifest_path)
+        return
+    files_with_hashes, fetched = _download_all(jobs, force=force, transport=transport)
+    manifest_kwargs = {
+        "base_dir": manifest_path.parent,
+        "sources": list(urls.values()),
+        "urlset_hash": fingerprint,
+    }
+    if not fetched and manifest_matches(
+        manifest_path, source_url, files_with_hashes, **manifest_kwargs
+    ):
+        logger.info("Manifest unchanged: %s", manifest_path)
+        return
+    write_manifest(manifest_path, source_url, files_with_hashes, **manifest_kwargs)
+    logger.info("Wrote manifest to %s", manifest_path)
+
+
+def _sha256_or_none(path: Path) -> str | None:
+    try:
+        return file_sha256(path)
+    except OSError:
+        return None
+
+
+def download_regulations(
+    raw_dir: Path,
+    *,
+    force: bool = False,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
     """Download NAIC model law PDFs and state adoption charts to raw_dir/regulations/naic/."""
     out_base = raw_dir / "regulations" / "naic"
     out_base.mkdir(parents=True, exist_ok=True)
-    files_with_hashes: list[tuple[Path, str | None]] = []
-
-    with httpx.Client(
-        timeout=DOWNLOAD_TIMEOUT,
-        follow_redirects=True,
-        headers=DOWNLOAD_HEADERS,
-    ) as client:
-        for key, url in REGULATIONS_URLS.items():
-            name = f"{key}.pdf"
-            dest = out_base / name
-            logger.info("Downloading %s -> %s", url, dest)
-            ok = _download_url_to_file(client, url, dest, force=force, binary=True)
-            if ok:
-                try:
-                    h = file_sha256(dest)
-                except OSError:
-                    h = None
-                files_with_hashes.append((dest, h))
-
-    manifest_path = out_base / "manifest.json"
-    write_manifest(
-        manifest_path,
+    jobs = [
+        (url, out_base / f"{key}.pdf") for key, url in REGULATIONS_URLS.items()
+    ]
+    _download_category(
+        jobs,
+        out_base / "manifest.json",
         NAIC_BASE,
-        files_with_hashes,
-        base_dir=out_base,
-        sources=list(REGULATIONS_URLS.values()),
+        REGULATIONS_URLS,
+        force=force,
+        transport=transport,
     )
-    logger.info("Wrote manifest to %s", manifest_path)
 
 
-def download_forms(raw_dir: Path, *, force: bool = False) -> None:
+def download_forms(
+    raw_dir: Path,
+    *,
+    force: bool = False,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
     """Download state consumer guides (PDF or HTML) to raw_dir/forms/{state}/ and raw_dir/forms/naic/."""
     out_base = raw_dir / "forms"
-    files_with_hashes: list[tuple[Path, str | None]] = []
+    jobs: list[tuple[str, Path]] = []
+    for key, url in FORMS_URLS.items():
+        key_lower = key.lower()
+        if key_lower == "naic":
+            subdir = out_base / "naic"
+        else:
+            subdir = out_base / key
+        subdir.mkdir(parents=True, exist_ok=True)
 
-    with httpx.Client(
-        timeout=DOWNLOAD_TIMEOUT,
-        follow_redirects=True,
-        headers=DOWNLOAD_HEADERS,
-    ) as client:
-        for key, url in FORMS_URLS.items():
-            key_lower = key.lower()
-            if key_lower == "naic":
-                subdir = out_base / "naic"
-            else:
-                subdir = out_base / key
-            subdir.mkdir(parents=True, exist_ok=True)
-
-            is_html = key in FORMS_HTML_KEYS
-            if is_html:
-                ext = ".html"
-                default_name = "guide.html"
-            else:
-                ext = ".pdf"
-                default_name = "guide.pdf"
-            name = sanitize_filename_from_url(url, default_name)
-            if not name.lower().endswith(ext.lstrip(".")):
-                name = name.rsplit(".", 1)[0] + ext if "." in name else name + ext
-            dest = subdir / name
-
-            if dest.exists() and not force:
-                logger.debug("Skipping (exists): %s", dest)
-                try:
-                    h = file_sha256(dest)
-                except OSError:
-                    h = None
-                files_with_hashes.append((dest, h))
-                continue
-            try:
-                logger.info("Downloading %s -> %s", url, dest)
-                ok = _download_url_to_file(client, url, dest, force=force, binary=not is_html)
-                if ok:
-                    try:
-                        h = file_sha256(dest)
-                    except OSError:
-                        h = None
-                    files_with_hashes.append((dest, h))
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    logger.warning("Skipping (404): %s", url)
-                else:
-                    raise
-
-    manifest_path = out_base / "manifest.json"
-    write_manifest(
-        manifest_path,
+        is_html = key in FORMS_HTML_KEYS
+        if is_html:
+            ext = ".html"
+            default_name = "guide.html"
+        else:
+            ext = ".pdf"
+            default_name = "guide.pdf"
+        name = sanitize_filename_from_url(url, default_name)
+        if not name.lower().endswith(ext.lstrip(".")):
+            name = name.rsplit(".", 1)[0] + ext if "." in name else name + ext
+        jobs.append((url, subdir / name))
+    _download_category(
+        jobs,
+        out_base / "manifest.json",
         "state_doi_and_naic",
-        files_with_hashes,
-        base_dir=out_base,
-        sources=list(FORMS_URLS.values()),
+        FORMS_URLS,
+        force=force,
+        transport=transport,
     )
-    logger.info("Wrote manifest to %s", manifest_path)
 
 
-def download_claims(raw_dir: Path, *, force: bool = False) -> None:
+def download_claims(
+    raw_dir: Path,
+    *,
+    force: bool = False,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
     """Download claims process guides to raw_dir/claims/. Limited public sources."""
     out_base = raw_dir / "claims"
     out_base.mkdir(parents=True, exist_ok=True)
-    files_with_hashes: list[tuple[Path, str | None]] = []
-
-    with httpx.Client(
-        timeout=DOWNLOAD_TIMEOUT,
-        follow_redirects=True,
-        headers=DOWNLOAD_HEADERS,
-    ) as client:
-        for key, url in CLAIMS_URLS.items():
-            is_html = ".html" in url or not url.rstrip("/").lower().endswith(".pdf")
-            ext = ".html" if is_html else ".pdf"
-            name = sanitize_filename_from_url(url, f"{key}{ext}")
-            if not name.lower().endswith(ext.lstrip(".")):
-                name = name.rsplit(".", 1)[0] + ext if "." in name else name + ext
-            dest = out_base / name
-            if dest.exists() and not force:
-                logger.debug("Skipping (exists): %s", dest)
-                try:
-                    h = file_sha256(dest)
-                except OSError:
-                    h = None
-                files_with_hashes.append((dest, h))
-                continue
-            try:
-                logger.info("Downloading %s -> %s", url, dest)
-                ok = _download_url_to_file(client, url, dest, force=force, binary=not is_html)
-                if ok:
-                    try:
-                        h = file_sha256(dest)
-                    except OSError:
-                        h = None
-                    files_with_hashes.append((dest, h))
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    logger.warning("Skipping (404): %s", url)
-                else:
-                    raise
-
-    manifest_path = out_base / "manifest.json"
-    write_manifest(
-        manifest_path,
+    jobs: list[tuple[str, Path]] = []
+    for key, url in CLAIMS_URLS.items():
+        is_html = ".html" in url or not url.rstrip("/").lower().endswith(".pdf")
+        ext = ".html" if is_html else ".pdf"
+        name = sanitize_filename_from_url(url, f"{key}{ext}")
+        if not name.lower().endswith(ext.lstrip(".")):
+            name = name.rsplit(".", 1)[0] + ext if "." in name else name + ext
+        jobs.append((url, out_base / name))
+    _download_category(
+        jobs,
+        out_base / "manifest.json",
         "state_doi_claims",
-        files_with_hashes,
-        base_dir=out_base,
-        sources=list(CLAIMS_URLS.values()),
+        CLAIMS_URLS,
+        force=force,
+        transport=transport,
     )
-    logger.info("Wrote manifest to %s", manifest_path)
 
 
-def download_rates(raw_dir: Path, *, force: bool = False) -> None:
+def download_rates(
+    raw_dir: Path,
+    *,
+    force: bool = False,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
     """Download rate-related docs (e.g. NY consolidated auto rules) to raw_dir/rates/. Limited public sources."""
     out_base = raw_dir / "rates"
     out_base.mkdir(parents=True, exist_ok=True)
-    files_with_hashes: list[tuple[Path, str | None]] = []
-
-    with httpx.Client(
-        timeout=DOWNLOAD_TIMEOUT,
-        follow_redirects=True,
-        headers=DOWNLOAD_HEADERS,
-    ) as client:
-        for key, url in RATES_URLS.items():
-            name = sanitize_filename_from_url(url, f"{key}.pdf")
-            if not name.lower().endswith(".pdf"):
-                # Ensure a .pdf extension while preserving the base name:
-                # - If there is no dot in the name, just append ".pdf".
-                # - If there is a dot, replace only the final extension with ".pdf"
-                #   (e.g., "file.name.txt" -> "file.name.pdf", not "file.pdf").
-                name = name + ".pdf" if "." not in name else name.rsplit(".", 1)[0] + ".pdf"
-            dest = out_base / name
-            logger.info("Downloading %s -> %s", url, dest)
-            ok = _download_url_to_file(client, url, dest, force=force, binary=True)
-            if ok:
-                try:
-                    h = file_sha256(dest)
-                except OSError:
-                    h = None
-                files_with_hashes.append((dest, h))
-
-    manifest_path = out_base / "manifest.json"
-    write_manifest(
-        manifest_path,
+    jobs: list[tuple[str, Path]] = []
+    for key, url in RATES_URLS.items():
+        name = sanitize_filename_from_url(url, f"{key}.pdf")
+        if not name.lower().endswith(".pdf"):
+            # Ensure a .pdf extension while preserving the base name:
+            # - If there is no dot in the name, just append ".pdf".
+            # - If there is a dot, replace only the final extension with ".pdf"
+            #   (e.g., "file.name.txt" -> "file.name.pdf", not "file.pdf").
+            name = name + ".pdf" if "." not in name else name.rsplit(".", 1)[0] + ".pdf"
+        jobs.append((url, out_base / name))
+    _download_category(
+        jobs,
+        out_base / "manifest.json",
         "state_doi_rates",
-        files_with_hashes,
-        base_dir=out_base,
-        sources=list(RATES_URLS.values()),
+        RATES_URLS,
+        force=force,
+        transport=transport,
     )
-    logger.info("Wrote manifest to %s", manifest_path)
@@ -2,19 +2,47 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+import orjson
 import pdfplumber
 from bs4 import BeautifulSoup
 
+from insurance_rag.config import EXTRACT_WORKERS
+from insurance_rag.download._utils import write_if_changed
+from insurance_rag.ingest.pdf import pdfium, pdfium_page_texts
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+# Non-content elements dropped before HTML text extraction.
+_HTML_STRIP_TAGS = ["script", "style", "nav", "header", "footer", "aside"]
+
 
 def _extract_pdf_text(pdf_path: Path) -> str:
-    """Extract text from a PDF via pdfplumber."""
+    """Extract text from a PDF.
+
+    Uses PDFium when installed (``pip install -e ".[pdfium]"``), falling back to
+    pdfplumber if it is missing, cannot open the file, or recovers no text.
+    """
+    if pdfium is not None:
+        try:
+            text = _extract_pdf_text_pdfium(pdf_path)
+        except pdfium.PdfiumError as e:
+            logger.debug("PDFium could not read %s (%s); using pdfplumber", pdf_path, e)
+        else:
+            if text:
+                return text
     parts = []
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
@@ -24,13 +52,30 @@ def _extract_pdf_text(pdf_path: Path) -> str:
     return "\n\n".join(parts)
 
 
+def _extract_pdf_text_pdfium(pdf_path: Path) -> str:
+    """Extract text from a PDF via PDFium, one non-empty page per paragraph."""
+    parts, _ = pdfium_page_texts(pdf_path)
+    return "\n\n".join(parts)
+
+
 def _extract_html_text(html_path: Path) -> str:
-    """Extract main text from an HTML file."""
-    raw = html_path.read_text(encoding="utf-8", errors="replace")
-    soup = BeautifulSoup(raw, "html.parser")
-    for tag in soup.find_all(["script", "style", "nav", "header", "footer", "aside"]):
-        tag.decompose()
-    text = soup.get_text(separator="\n", strip=True)
+    """Extract main text from an HTML file.
+
+    Uses selectolax when installed (``pip install -e ".[fast-html]"``), otherwise
+    BeautifulSoup with the stdlib parser.
+    """
+    # Parse bytes so the parser can honour the page's declared charset.
+    raw = html_path.read_bytes()
+    if HTMLParser is not None:
+        tree = HTMLParser(raw)
+        tree.strip_tags(_HTML_STRIP_TAGS)
+        node = tree.body or tree.root
+        text = node.text(separator="\n", strip=True) if node is not None else ""
+    else:
+        soup = BeautifulSoup(raw, "html.parser")
+        for tag in soup.find_all(_HTML_STRIP_TAGS):
+            tag.decompose()
+        text = soup.get_text(separator="\n", strip=True)
     return "\n".join(line.strip() for line in text.splitlines() if line.strip())
 
 
@@ -42,54 +87,120 @@ def _write_doc(
     out_dir.mkdir(parents=True, exist_ok=True)
     txt_path = out_dir / f"{doc_id}.txt"
     meta_path = out_dir / f"{doc_id}.meta.json"
-    txt_path.write_text(text, encoding="utf-8")
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    write_if_changed(txt_path, text.encode("utf-8"))
+    write_if_changed(meta_path, orjson.dumps(meta, option=orjson.OPT_INDENT_2))
     return txt_path, meta_path
 
 
-def _extract_from_dir(
-    processed_dir: Path,
-    raw_subdir: Path,
-    processed_subdir: str,
-    source_kind: str,
-    *,
-    force: bool,
-) -> list[tuple[Path, Path]]:
-    """Walk raw_subdir for PDFs and HTML, extract text, write to processed_subdir."""
+_SOURCE_SUFFIXES = frozenset({".pdf", ".html", ".htm"})
+
+# (raw path, doc_id, processed subdir, source kind)
+_Source = tuple[Path, str, str, str]
+
+
+def _read_source_text(path: Path) -> str | None:
+    """Extract text from a PDF or HTML file; None if extraction failed.
+
+    Top-level so it can be shipped to worker processes.
+    """
+    try:
+        if path.suffix.lower() == ".pdf":
+            return _extract_pdf_text(path)
+        return _extract_html_text(path)
+    except Exception as e:
+        logger.warning("Extract failed for %s (%s): %s", path, type(e).__name__, e)
+        return None
+
+
+def _read_source_texts(paths: list[Path]) -> Iterator[str | None]:
+    """:func:`_read_source_text` over paths, in a process pool when EXTRACT_WORKERS > 1.
+
+    Texts are yielded in path order as they become available. At most
+    ``workers * 2`` paths are submitted ahead of the consumer (Executor.map
+    would queue them all and let finished texts pile up behind a slow one).
+    """
+    workers = min(EXTRACT_WORKERS, len(paths))
+    if workers <= 1:
+        yield from map(_read_source_text, paths)
+        return
+    remaining = iter(paths)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        window: deque[Future[str | None]] = deque(
+            ex.submit(_read_source_text, path) for path in islice(remaining, workers * 2)
+        )
+        while window:
+            text = window.popleft().result()
+            for path in islice(remaining, 1):
+                window.append(ex.submit(_read_source_text, path))
+            yield text
+
+
+_UNSAFE_ID_CHARS_RE = re.compile(r"[^a-zA-Z0-9_-]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
+def _doc_id_for(path: Path) -> str:
+    doc_id = path.stem
+    if not doc_id.replace("-", "").replace("_", "").isalnum():
+        doc_id = _UNSAFE_ID_CHARS_RE.sub("_", path.stem)
+        doc_id = _UNDERSCORE_RUN_RE.sub("_", doc_id).strip("_") or "doc"
+    return doc_id
+
+
+def _collect_sources(
+    raw_subdir: Path, processed_subdir: str, source_kind: str
+) -> list[_Source]:
+    """List the PDFs and HTML files under raw_subdir, sorted by path."""
     if not raw_subdir.exists():
         logger.warning("Raw subdir not found: %s", raw_subdir)
         return []
-    written: list[tuple[Path, Path]] = []
-    for path in sorted(raw_subdir.rglob("*")):
-        if not path.is_file():
+    return [
+        (path, _doc_id_for(path), processed_subdir, source_kind)
+        for path in sorted(raw_subdir.rglob("*"))
+        if path.suffix.lower() in _SOURCE_SUFFIXES and path.is_file()
+    ]
+
+
+def _extract_sources(
+    processed_dir: Path, sources: list[_Source], *, force: bool
+) -> list[tuple[Path, Path]]:
+    """Extract text from sources and write them to processed_dir.
+
+    Sources whose outputs already exist are skipped unless force is set; the
+    rest are extracted together (see :func:`_read_source_texts`).
+    """
+    return list(_iter_extract_sources(processed_dir, sources, force=force))
+
+
+def _iter_extract_sources(
+    processed_dir: Path, sources: list[_Source], *, force: bool
+) -> Iterator[tuple[Path, Path]]:
+    """Generator form of :func:`_extract_sources`; yields each (txt, meta) pair
+    as soon as it is written."""
+    pending: list[_Source] = []
+    for source in sources:
+        _, doc_id, processed_subdir, _ = source
+        out_dir = processed_dir / processed_subdir
+        if force or not (
+            (out_dir / f"{doc_id}.txt").exists() and (out_dir / f"{doc_id}.meta.json").exists()
+        ):
+            pending.append(source)
+    pending_paths = {src[0] for src in pending}
+    # Consumed in source order; besides the text being written, only the
+    # bounded read-ahead window of _read_source_texts is held in memory.
+    texts = _read_source_texts([src[0] for src in pending])
+
+    for path, doc_id, processed_subdir, source_kind in sources:
+        if path not in pending_paths:
+            out_dir = processed_dir / processed_subdir
+            yield out_dir / f"{doc_id}.txt", out_dir / f"{doc_id}.meta.json"
             continue
-        suf = path.suffix.lower()
-        if suf == ".pdf":
-            try:
-                text = _extract_pdf_text(path)
-            except Exception as e:
-                logger.warning("Extract failed for %s (%s): %s", path, type(e).__name__, e)
-                continue
-        elif suf in (".html", ".htm"):
-            try:
-                text = _extract_html_text(path)
-            except (OSError, UnicodeError) as e:
-                logger.warning("Extract failed for %s (%s): %s", path, type(e).__name__, e)
-                continue
-        else:
+        text = next(texts)
+        if text is None:
             continue
         if not text.strip():
             logger.warning("No text recovered for %s; skipping", path)
             continue
-        doc_id = path.stem
-        if not doc_id.replace("-", "").replace("_", "").isalnum():
-            doc_id = re.sub(r"[^a-zA-Z0-9_-]", "_", path.stem)
-            doc_id = re.sub(r"_+", "_", doc_id).strip("_") or "doc"
-        out_txt = processed_dir / processed_subdir / f"{doc_id}.txt"
-        out_meta = processed_dir / processed_subdir / f"{doc_id}.meta.json"
-        if not force and out_txt.exists() and out_meta.exists():
-            written.append((out_txt, out_meta))
-            continue
         meta = {
             "source": source_kind,
             "doc_id": f"{source_kind}_{doc_id}",
@@ -98,9 +209,24 @@ def _extract_from_dir(
         txt_path, meta_path = _write_doc(
             processed_dir, processed_subdir, doc_id, text, meta
         )
-        written.append((txt_path, meta_path))
         logger.info("Wrote %s (%d chars)", txt_path, len(text))
-    return written
+        yield txt_path, meta_path
+
+
+def _extract_from_dir(
+    processed_dir: Path,
+    raw_subdir: Path,
+    processed_subdir: str,
+    source_kind: str,
+    *,
+    force: bool,
+) -> list[tuple[Path, Path]]:
+    """Walk raw_subdir for PDFs and HTML, extract text, write to processed_subdir."""
+    return _extract_sources(
+        processed_dir,
+        _collect_sources(raw_subdir, processed_subdir, source_kind),
+        force=force,
+    )
 
 
 def extract_regulations(
@@ -124,21 +250,14 @@ def extract_forms(
     if not forms_raw.exists():
         logger.warning("Forms raw dir not found: %s", forms_raw)
         return []
-    written: list[tuple[Path, Path]] = []
+    # Collect every state's files first so they share one extraction pass.
+    sources: list[_Source] = []
     for subdir in sorted(forms_raw.iterdir()):
         if not subdir.is_dir():
             logger.debug("Skipping non-directory entry in forms directory: %s", subdir)
             continue
-        written.extend(
-            _extract_from_dir(
-                processed_dir,
-                subdir,
-                f"forms/{subdir.name}",
-                "forms",
-                force=force,
-            )
-        )
-    return written
+        sources.extend(_collect_sources(subdir, f"forms/{subdir.name}", "forms"))
+    return _extract_sources(processed_dir, sources, force=force)
 
 
 def extract_claims(
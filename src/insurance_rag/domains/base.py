@@ -1,10 +1,47 @@
 """Base class for insurance domain plugins."""
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+
+class SynonymScanner:
+    """Matches a ``(compiled_regex, expansion)`` synonym list against text.
+
+    The patterns are also joined into one alternation used as a prefilter:
+    text that matches none of them is rejected in a single scan instead of
+    one ``search`` per pattern. Patterns are only joined when they share
+    flags and have no capture groups (so backreferences stay valid).
+    """
+
+    def __init__(self, synonym_map: Sequence[tuple[re.Pattern[str], str]]) -> None:
+        self._entries = tuple(synonym_map)
+        self._any = _join_patterns([p for p, _ in self._entries])
+
+    def expansions(self, text: str) -> list[str]:
+        """Return the expansions whose patterns match text, in map order."""
+        if self._any is not None and not self._any.search(text):
+            return []
+        return [expansion for pattern, expansion in self._entries if pattern.search(text)]
+
+
+def _join_patterns(patterns: list[re.Pattern[str]]) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    flags = patterns[0].flags
+    if any(p.flags != flags or p.groups for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), flags)
+    except re.error:
+        return None
+
 
 class InsuranceDomain(ABC):
     """Abstract base for all insurance domain plugins.
@@ -59,6 +96,14 @@ class InsuranceDomain(ABC):
     def get_topic_definitions_path(self) -> Path:
         """Path to this domain's ``topics.json``."""
 
+    @cached_property
+    def topic_definitions(self) -> list[dict[str, Any]]:
+        """Parsed contents of :meth:`get_topic_definitions_path`, loaded once per instance.
+
+        Raises OSError if the file is missing or unreadable.
+        """
+        return orjson.loads(self.get_topic_definitions_path().read_bytes())
+
     # ------------------------------------------------------------------
     # Query / retrieval
     # ------------------------------------------------------------------
@@ -89,6 +134,11 @@ class InsuranceDomain(ABC):
     def get_synonym_map(self) -> list[tuple[Any, str]]:
         """List of (compiled_regex, expansion_string) for domain synonyms."""
 
+    @cached_property
+    def synonym_scanner(self) -> SynonymScanner:
+        """Scanner over :meth:`get_synonym_map`, built once per instance."""
+        return SynonymScanner(self.get_synonym_map())
+
     @abstractmethod
     def get_system_prompt(self) -> str:
         """System prompt for the RAG chain LLM."""
@@ -128,3 +178,8 @@ class InsuranceDomain(ABC):
         Return None to skip extra source-filtered search.
         """
         return None
+
+    @cached_property
+    def specialized_source_filter(self) -> dict[str, str] | None:
+        """:meth:`get_specialized_source_filter`, computed once per instance."""
+        return self.get_specialized_source_filter()
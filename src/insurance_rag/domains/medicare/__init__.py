@@ -1,6 +1,7 @@
 """Medicare insurance domain plugin."""
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -66,6 +67,11 @@ class MedicareDomain(InsuranceDomain):
         return Path(__file__).parent / "data" / "topics.json"
 
     def get_query_patterns(self) -> dict[str, Any]:
+        return self.query_patterns
+
+    @cached_property
+    def query_patterns(self) -> dict[str, Any]:
+        """Query patterns dict, built once per instance. Callers must not mutate it."""
         from insurance_rag.domains.medicare.patterns import (
             LCD_QUERY_PATTERNS,
             LCD_TOPIC_PATTERNS,
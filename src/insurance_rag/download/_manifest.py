@@ -1,17 +1,99 @@
 """Shared manifest writing for download scripts."""
 import hashlib
-import json
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
+from insurance_rag.download._utils import write_if_changed
+
+# Keys compared by manifest_matches (everything but download_date).
+_MANIFEST_CONTENT_KEYS = ("source_url", "files", "sources", "urlset_hash")
+
 
 def file_sha256(path: Path) -> str:
-    """Return SHA-256 hex digest of file."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    """Return SHA-256 hex digest of file.
+
+    Uses :func:`hashlib.file_digest`, which reads into a reused buffer and
+    hashes without holding the GIL, so several files can be hashed in threads.
+    """
+    with open(path, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def read_manifest(manifest_path: Path) -> dict | None:
+    """Return the parsed manifest at manifest_path, or None if missing or unreadable.
+
+    Parsed manifests are cached per (path, mtime, size); treat the result as read-only.
+    """
+    try:
+        st = manifest_path.stat()
+    except OSError:
+        return None
+    return _read_manifest_cached(str(manifest_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _read_manifest_cached(path: str, mtime_ns: int, size: int) -> dict | None:
+    try:
+        data = orjson.loads(Path(path).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _manifest_entry(fp: Path, fhash: str | None, base: Path) -> dict:
+    """Manifest record for fp, with its path relative to the resolved base when possible."""
+    try:
+        rel = fp.resolve().relative_to(base)
+    except ValueError:
+        rel = fp
+    return {"path": str(rel), "file_hash": fhash}
+
+
+def _manifest_data(
+    manifest_path: Path,
+    source_url: str,
+    files: list[tuple[Path, str | None]],
+    *,
+    base_dir: Path | None,
+    sources: list[str] | None,
+    urlset_hash: str | None,
+) -> dict:
+    base = (base_dir or manifest_path.parent).resolve()
+    data: dict = {
+        "source_url": source_url,
+        "download_date": datetime.now(UTC).isoformat(),
+        "files": [_manifest_entry(fp, fhash, base) for fp, fhash in files],
+    }
+    if sources is not None:
+        data["sources"] = sources
+    if urlset_hash is not None:
+        data["urlset_hash"] = urlset_hash
+    return data
+
+
+def manifest_matches(
+    manifest_path: Path,
+    source_url: str,
+    files: list[tuple[Path, str | None]],
+    *,
+    base_dir: Path | None = None,
+    sources: list[str] | None = None,
+    urlset_hash: str | None = None,
+) -> bool:
+    """True if the manifest on disk already records this source_url, files, sources and
+    urlset_hash (download_date is not compared). Arguments are as for :func:`write_manifest`.
+    """
+    existing = read_manifest(manifest_path)
+    if existing is None:
+        return False
+    data = _manifest_data(
+        manifest_path, source_url, files,
+        base_dir=base_dir, sources=sources, urlset_hash=urlset_hash,
+    )
+    return all(existing.get(key) == data.get(key) for key in _MANIFEST_CONTENT_KEYS)
 
 
 def write_manifest(
@@ -21,27 +103,19 @@ def write_manifest(
     *,
     base_dir: Path | None = None,
     sources: list[str] | None = None,
+    urlset_hash: str | None = None,
 ) -> None:
     """Write manifest.json with source_url, download_date, and file list with optional hashes.
 
     files: list of (absolute_path, hash_or_none). If base_dir is set, stored paths are relative to it.
     sources: optional list of URLs for multi-source manifests (e.g. HCPCS + ICD-10-CM).
+    urlset_hash: optional fingerprint of the configured URL set, for cheap up-to-date checks.
     """
-    base = base_dir or manifest_path.parent
-    entries = []
-    for fp, fhash in files:
-        try:
-            rel = fp.resolve().relative_to(base.resolve())
-        except ValueError:
-            rel = fp
-        entries.append({"path": str(rel), "file_hash": fhash})
-    data: dict = {
-        "source_url": source_url,
-        "download_date": datetime.now(UTC).isoformat(),
-        "files": entries,
-    }
-    if sources is not None:
-        data["sources"] = sources
+    data = _manifest_data(
+        manifest_path, source_url, files,
+        base_dir=base_dir, sources=sources, urlset_hash=urlset_hash,
+    )
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(manifest_path, "w") as f:
-        json.dump(data, f, indent=2)
+    write_if_changed(manifest_path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    # mtime may not advance on coarse-timestamp filesystems; drop stale parses.
+    _read_manifest_cached.cache_clear()
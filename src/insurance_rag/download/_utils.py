@@ -1,4 +1,6 @@
 """Shared utilities for download scripts."""
+import os
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import unquote, urlparse
 
@@ -8,6 +10,9 @@ from insurance_rag.config import DOWNLOAD_TIMEOUT
 
 _ALLOWED_SCHEMES = ("http", "https")
 
+# Streaming read size; keeps memory flat regardless of response size.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 __all__ = ("DOWNLOAD_TIMEOUT",)
 
 
@@ -25,29 +30,96 @@ def _validate_download_url(url: str) -> None:
         )
 
 
+def _part_path(dest: Path) -> Path:
+    return dest.with_name(dest.name + ".part")
+
+
 def stream_download(client: httpx.Client, url: str, dest: Path) -> None:
     """Stream GET url to dest path. Raises on HTTP errors.
 
     Only http and https URLs are permitted; file:// and other schemes are rejected.
+    The body is written in DOWNLOAD_CHUNK_SIZE chunks to a ``.part`` sibling and
+    renamed onto dest on success, so an interrupted download never leaves a
+    truncated dest behind.
     """
     _validate_download_url(url)
-    with client.stream("GET", url) as r:
-        r.raise_for_status()
-        with dest.open("wb") as f:
-            for chunk in r.iter_bytes():
-                if chunk:
-                    f.write(chunk)
+    tmp = _part_path(dest)
+    try:
+        with client.stream("GET", url) as r:
+            r.raise_for_status()
+            with open(tmp, "wb", buffering=0) as f:
+                for chunk in r.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+async def astream_download(client: httpx.AsyncClient, url: str, dest: Path) -> None:
+    """Async variant of :func:`stream_download` for an ``httpx.AsyncClient``."""
+    _validate_download_url(url)
+    tmp = _part_path(dest)
+    try:
+        async with client.stream("GET", url) as r:
+            r.raise_for_status()
+            with open(tmp, "wb", buffering=0) as f:
+                async for chunk in r.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless the file already holds exactly these bytes.
+
+    A size mismatch decides without reading the file. Writes go to a ``.part``
+    sibling and are renamed into place. Returns True if the file was written.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if st.st_size == len(data) and path.read_bytes() == data:
+            return False
+    tmp = _part_path(path)
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
+
+@lru_cache(maxsize=1024)
 def sanitize_filename_from_url(url: str, default_basename: str) -> str:
     """Extract a safe filename from a URL (no path traversal).
 
-    Uses only the last path segment and strips query string. Decodes percent-encoding
-    before checking for traversal. Returns default_basename if the result would be
-    empty or contain path traversal (e.g. "..").
+    Uses only the last path segment and strips query string and fragment. Decodes
+    percent-encoding before checking for traversal. Returns default_basename if the
+    result would be empty or contain path traversal (e.g. ".."), or if *url* has no
+    "/" at all.
+
+    Parsed with plain string operations rather than ``urlparse``: download loops
+    call this once per URL and only ever need the final path segment. Results are
+    memoized, since the configured URL sets are small and fixed.
     """
-    path = urlparse(url).path or ""
-    name = unquote(path.rstrip("/").split("/")[-1].split("?")[0].strip())
+    if "/" not in url:
+        return default_basename
+    url = url.split("#", 1)[0].split("?", 1)[0]
+    scheme_end = url.find("://")
+    if scheme_end != -1:
+        # Drop scheme and netloc; a bare host has an empty path.
+        path_start = url.find("/", scheme_end + 3)
+        url = url[path_start:] if path_start != -1 else ""
+    segment = url.rstrip("/").rpartition("/")[2].partition(";")[0]
+    name = unquote(segment.strip())
     if (
         not name
         or ".." in name
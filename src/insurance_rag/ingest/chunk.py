@@ -7,6 +7,7 @@ fragmented content to improve retrieval consistency across rephrasings.
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -79,16 +80,18 @@ def _is_mcd_doc(meta: dict) -> bool:
     return meta.get("source") == "mcd"
 
 
-def _uses_large_chunk_splitter(
-    meta: dict, domain: "InsuranceDomain | None"
-) -> bool:
-    """True if this doc's source has chunk size overrides (e.g. mcd, regulations)."""
-    if domain is None:
-        return meta.get("source") == "mcd"
-    overrides = domain.get_chunk_overrides()
-    if not overrides:
-        return False
-    return meta.get("source") in overrides
+_SEPARATORS = ("\n\n", "\n", ". ", " ", "")
+
+
+@lru_cache(maxsize=16)
+def _get_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Shared splitter per (chunk_size, chunk_overlap); split_text keeps no state."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        separators=list(_SEPARATORS),
+    )
 
 
 def chunk_documents(
@@ -121,37 +124,27 @@ def chunk_documents(
     pairs = _load_extracted_docs(processed_dir, source, domain)
     overrides = domain.get_chunk_overrides() if domain else None
 
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        length_function=len,
-        separators=["\n\n", "\n", ". ", " ", ""],
-    )
-    lcd_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=lcd_chunk_size,
-        chunk_overlap=lcd_chunk_overlap,
-        length_function=len,
-        separators=["\n\n", "\n", ". ", " ", ""],
-    )
+    splitter = _get_splitter(chunk_size, chunk_overlap)
+    lcd_splitter = _get_splitter(lcd_chunk_size, lcd_chunk_overlap)
+    # Without a domain, MCD keeps its historical larger chunks; with one, its overrides decide.
+    source_splitters: dict[str, RecursiveCharacterTextSplitter] = {}
+    if domain is None:
+        source_splitters["mcd"] = lcd_splitter
+    elif overrides:
+        source_splitters = {
+            src: _get_splitter(
+                cfg.get("chunk_size", lcd_chunk_size),
+                cfg.get("chunk_overlap", lcd_chunk_overlap),
+            )
+            for src, cfg in overrides.items()
+        }
     documents: list[Document] = []
     for content, meta in pairs:
         parent_meta = {k: v for k, v in meta.items() if v is not None}
         if _is_code_doc(meta):
             documents.append(Document(page_content=content.strip(), metadata=parent_meta))
         else:
-            use_large = _uses_large_chunk_splitter(meta, domain)
-            if use_large and overrides and meta.get("source") in overrides:
-                src_overrides = overrides[meta["source"]]
-                size = src_overrides.get("chunk_size", lcd_chunk_size)
-                overlap = src_overrides.get("chunk_overlap", lcd_chunk_overlap)
-                active_splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=size,
-                    chunk_overlap=overlap,
-                    length_function=len,
-                    separators=["\n\n", "\n", ". ", " ", ""],
-                )
-            else:
-                active_splitter = lcd_splitter if use_large else splitter
+            active_splitter = source_splitters.get(meta.get("source"), splitter)
             chunks = active_splitter.split_text(content)
             for i, chunk in enumerate(chunks):
                 chunk_meta = dict(parent_meta)
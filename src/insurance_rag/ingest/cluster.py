@@ -42,6 +42,7 @@ def _compile(raw: list[str]) -> tuple[re.Pattern[str], ...]:
 
 def _load_topic_definitions(domain_name: str | None = None) -> list[TopicDef]:
     """Load topic definitions from the given domain, DATA_DIR, or package default."""
+    data: list[dict] | None = None
     raw: str | None = None
 
     # 1. Try the domain's topic definitions
@@ -50,14 +51,12 @@ def _load_topic_definitions(domain_name: str | None = None) -> list[TopicDef]:
         from insurance_rag.domains import get_domain
 
         domain = get_domain(domain_name or DEFAULT_DOMAIN)
-        domain_path = domain.get_topic_definitions_path()
-        if domain_path.exists():
-            raw = domain_path.read_text(encoding="utf-8")
+        data = domain.topic_definitions
     except (KeyError, ImportError, OSError) as e:
         logger.debug("Domain topic definitions not available: %s", e)
 
     # 2. Fallback: DATA_DIR/topic_definitions.json
-    if raw is None:
+    if data is None:
         path = DATA_DIR / "topic_definitions.json"
         if path.exists():
             try:
@@ -66,7 +65,7 @@ def _load_topic_definitions(domain_name: str | None = None) -> list[TopicDef]:
                 logger.warning("Could not read %s: %s; using package default", path, e)
 
     # 3. Fallback: package default
-    if raw is None:
+    if data is None and raw is None:
         from importlib.resources import files
 
         pkg_path = files("insurance_rag") / "data" / "topic_definitions.json"
@@ -77,7 +76,8 @@ def _load_topic_definitions(domain_name: str | None = None) -> list[TopicDef]:
                 f"Topic definitions not found in domain, DATA_DIR, or package default: {e}"
             ) from e
 
-    data = json.loads(raw)
+    if data is None:
+        data = json.loads(raw)
     out: list[TopicDef] = []
     for item in data:
         name = item.get("name", "")
@@ -4,30 +4,50 @@ Output: one .txt + .meta.json per logical document under processed_dir.
 """
 
 import csv
-import json
+import io
 import logging
+import mmap
+import os
+import pickle
 import re
 import sys
 import xml.etree.ElementTree as ET
 import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from html import unescape
 from pathlib import Path
+from typing import IO
 from xml.etree.ElementTree import Element
 
+import orjson
 import pdfplumber
 from bs4 import BeautifulSoup
 
-from insurance_rag.config import CSV_FIELD_SIZE_LIMIT
+from insurance_rag.config import CSV_FIELD_SIZE_LIMIT, EXTRACT_WORKERS
+from insurance_rag.download._manifest import file_sha256
 from insurance_rag.ingest import SourceKind
 from insurance_rag.ingest.enrich import enrich_hcpcs_text, enrich_icd10_text
+from insurance_rag.ingest.pdf import pdfium, pdfium_page_texts
 
 try:
     import defusedxml.ElementTree as SafeET
 except ImportError:
     SafeET = None
 
+# BeautifulSoup tree builder for MCD HTML: lxml's C parser when installed
+# (``pip install -e ".[lxml]"``), else the pure-Python stdlib parser.
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    _HTML_PARSER = "html.parser"
+else:
+    _HTML_PARSER = "lxml"
+
 logger = logging.getLogger(__name__)
 
-# Minimum chars per page to consider pdfplumber extraction "good"
+# Minimum chars per page to consider PDF text extraction "good"
 _PDF_MIN_CHARS_PER_PAGE = 50
 
 _CSV_FIELD_LIMIT_INITIALIZED = False
@@ -130,17 +150,64 @@ def _meta_schema(
     return meta
 
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path with one raw open/write/close, creating the parent dir on demand.
+
+    Skips the text/buffer layers of ``Path.write_text`` and the per-file ``mkdir``;
+    code extractors write tens of thousands of small files. The bytes go to a
+    ``.part`` sibling that is renamed onto path, so an interrupted run never leaves a
+    truncated output that a later run would skip as already extracted. No fsync.
+    """
+    tmp = path.with_name(path.name + ".part")
+    try:
+        fd = os.open(tmp, _WRITE_FLAGS, 0o666)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp, _WRITE_FLAGS, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def _write_doc(processed_dir: Path, subdir: str, doc_id: str, text: str, meta: dict) -> tuple[Path, Path]:
     """Write a .txt and .meta.json pair under *processed_dir/subdir*. Returns (txt_path, meta_path)."""
     out_dir = processed_dir / subdir
-    out_dir.mkdir(parents=True, exist_ok=True)
     txt_path = out_dir / f"{doc_id}.txt"
     meta_path = out_dir / f"{doc_id}.meta.json"
-    txt_path.write_text(text, encoding="utf-8")
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    _write_bytes(txt_path, text.encode("utf-8"))
+    _write_bytes(meta_path, orjson.dumps(meta, option=orjson.OPT_INDENT_2))
     return txt_path, meta_path
 
 
+def _existing_outputs(out_dir: Path) -> set[str]:
+    """File names already in out_dir (empty if it does not exist).
+
+    One directory scan stands in for an ``exists()`` pair per document when code
+    extractors decide what to skip.
+    """
+    try:
+        with os.scandir(out_dir) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _has_outputs(existing: set[str], doc_id: str) -> bool:
+    """True if both the .txt and .meta.json for doc_id are in existing."""
+    return f"{doc_id}.txt" in existing and f"{doc_id}.meta.json" in existing
+
+
 # --- IOM ---
 
 def _should_skip_iom_pdf(name: str) -> bool:
@@ -174,7 +241,7 @@ def _iom_chapter_from_path(manual_id: str, rel_path: Path) -> str | None:
 
 
 def _extract_pdf_page_unstructured(pdf_path: Path) -> str:
-    """Return full document text via unstructured when pdfplumber yields little or no text.
+    """Return full document text via unstructured when PDF text extraction yields little or no text.
     Catches all exceptions so that missing optional dependency or partition_pdf() runtime/parsing
     errors do not abort the ingest pipeline.
     """
@@ -194,18 +261,45 @@ def _extract_pdf_page_unstructured(pdf_path: Path) -> str:
         return ""
 
 
-def _extract_iom_pdf(pdf_path: Path, manual_id: str, chapter: str | None) -> str:
-    """Extract text from an IOM chapter PDF, falling back to unstructured for scanned pages."""
-    parts = []
-    num_pages = 0
+def _pdf_page_texts(pdf_path: Path) -> list[str]:
+    """Stripped text of each page of a PDF ("" for pages without text).
+
+    Uses PDFium when installed (``pip install -e ".[pdfium]"``), falling back to
+    pdfplumber if it is missing, cannot open the file, or recovers no text.
+    """
+    if pdfium is not None:
+        try:
+            parts, num_pages = pdfium_page_texts(pdf_path)
+        except pdfium.PdfiumError as e:
+            logger.debug("PDFium could not read %s (%s); using pdfplumber", pdf_path, e)
+        else:
+            if parts:
+                return parts + [""] * (num_pages - len(parts))
+    pages = []
     with pdfplumber.open(pdf_path) as pdf:
-        num_pages = len(pdf.pages)
         for page in pdf.pages:
-            text = (page.extract_text() or "").strip()
-            if text:
-                parts.append(text)
-    result = "\n\n".join(parts)
-    # If pdfplumber got nothing or very little (e.g. scanned/image PDF), try unstructured once
+            pages.append((page.extract_text() or "").strip())
+            # Drop the page's cached objects; Page.close is pdfplumber >= 0.11 only.
+            close = getattr(page, "close", None) or page.flush_cache
+            close()
+    return pages
+
+
+# Reads a PDF's page texts; see _pdf_page_texts for the default.
+PdfTextFn = Callable[[Path], list[str]]
+
+
+def _extract_iom_pdf(
+    pdf_path: Path,
+    manual_id: str,
+    chapter: str | None,
+    pdf_text_fn: PdfTextFn = _pdf_page_texts,
+) -> str:
+    """Extract text from an IOM chapter PDF, falling back to unstructured for scanned pages."""
+    pages = pdf_text_fn(pdf_path)
+    num_pages = len(pages)
+    result = "\n\n".join(text for text in pages if text)
+    # If nothing or very little was recovered (e.g. scanned/image PDF), try unstructured once
     chars_per_page = len(result) / max(1, num_pages)
     if not result.strip() or chars_per_page < _PDF_MIN_CHARS_PER_PAGE:
         fallback = _extract_pdf_page_unstructured(pdf_path)
@@ -214,13 +308,78 @@ def _extract_iom_pdf(pdf_path: Path, manual_id: str, chapter: str | None) -> str
     return result
 
 
-def extract_iom(processed_dir: Path, raw_dir: Path, *, force: bool = False) -> list[tuple[Path, Path]]:
-    """Extract IOM chapter PDFs to processed_dir/iom/{manual_id}/."""
+def _read_iom_pdf(
+    job: tuple[Path, str, str | None], pdf_text_fn: PdfTextFn = _pdf_page_texts
+) -> str | None:
+    """:func:`_extract_iom_pdf` for one (pdf_path, manual_id, chapter); None on I/O failure.
+
+    Top-level so it can be shipped to worker processes.
+    """
+    pdf_path, manual_id, chapter = job
+    try:
+        return _extract_iom_pdf(pdf_path, manual_id, chapter, pdf_text_fn)
+    except OSError as e:
+        logger.warning("Extract failed for %s: %s", pdf_path, e)
+        return None
+
+
+def _is_picklable(obj: object) -> bool:
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _read_iom_pdfs(
+    jobs: list[tuple[Path, str, str | None]], pdf_text_fn: PdfTextFn = _pdf_page_texts
+) -> Iterator[str | None]:
+    """:func:`_read_iom_pdf` over jobs, in a process pool when EXTRACT_WORKERS > 1.
+
+    A pdf_text_fn that cannot be pickled (e.g. a lambda) is run in-process instead.
+    Texts are yielded in job order as they become available.
+    """
+    read = partial(_read_iom_pdf, pdf_text_fn=pdf_text_fn)
+    workers = min(EXTRACT_WORKERS, len(jobs))
+    if workers > 1 and not _is_picklable(pdf_text_fn):
+        logger.debug("pdf_text_fn %r cannot be sent to workers; reading PDFs serially", pdf_text_fn)
+        workers = 1
+    if workers <= 1:
+        yield from map(read, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield from ex.map(read, jobs)
+
+
+def _meta_src_sha256(meta_path: Path) -> str | None:
+    """The ``src_sha256`` recorded in an existing .meta.json, or None if absent/unreadable."""
+    try:
+        return orjson.loads(meta_path.read_bytes()).get("src_sha256")
+    except (OSError, orjson.JSONDecodeError, AttributeError):
+        return None
+
+
+def extract_iom(
+    processed_dir: Path,
+    raw_dir: Path,
+    *,
+    force: bool = False,
+    pdf_text_fn: PdfTextFn = _pdf_page_texts,
+) -> list[tuple[Path, Path]]:
+    """Extract IOM chapter PDFs to processed_dir/iom/{manual_id}/.
+
+    Each meta records the source PDF's SHA-256 (``src_sha256``); without force, a
+    chapter is re-extracted only when that hash no longer matches. PDFs are read in
+    worker processes (see ``EXTRACT_WORKERS``); outputs are written here, in sorted
+    path order. *pdf_text_fn* returns a PDF's page texts; one that cannot be pickled
+    runs in this process.
+    """
     iom_dir = raw_dir / "iom"
     if not iom_dir.exists():
         logger.warning("IOM raw dir not found: %s", iom_dir)
         return []
-    written: list[tuple[Path, Path]] = []
+    # (pdf_path, manual_id, chapter, doc_id, src_sha256, existing outputs or None)
+    sources: list[tuple[Path, str, str | None, str, str, tuple[Path, Path] | None]] = []
     for manual_path in sorted(iom_dir.iterdir()):
         if not manual_path.is_dir():
             continue
@@ -232,43 +391,109 @@ def extract_iom(processed_dir: Path, raw_dir: Path, *, force: bool = False) -> l
             doc_id = f"ch{chapter}" if chapter else pdf_path.stem
             out_txt = processed_dir / "iom" / manual_id / f"{doc_id}.txt"
             out_meta = processed_dir / "iom" / manual_id / f"{doc_id}.meta.json"
-            if not force and out_txt.exists() and out_meta.exists():
-                logger.debug("Skip (exists): %s", out_txt)
-                written.append((out_txt, out_meta))
-                continue
             try:
-                text = _extract_iom_pdf(pdf_path, manual_id, chapter)
+                src_sha256 = file_sha256(pdf_path)
             except OSError as e:
                 logger.warning("Extract failed for %s: %s", pdf_path, e)
                 continue
-            if not text.strip():
-                logger.warning("No text recovered for %s; skipping", pdf_path)
-                continue
-            meta = _meta_schema(
-                source="iom",
-                manual=manual_id,
-                chapter=chapter,
-                title=None,
-                effective_date=None,
-                source_url=None,
-                jurisdiction=None,
-                doc_id=f"iom_{manual_id}_{doc_id}",
-            )
-            txt_path, meta_path = _write_doc(processed_dir, f"iom/{manual_id}", doc_id, text, meta)
-            written.append((txt_path, meta_path))
-            logger.info("Wrote %s (%d chars)", txt_path, len(text))
+            existing = None
+            if (
+                not force
+                and out_txt.exists()
+                and _meta_src_sha256(out_meta) == src_sha256
+            ):
+                existing = (out_txt, out_meta)
+            sources.append((pdf_path, manual_id, chapter, doc_id, src_sha256, existing))
+
+    pending = [(pdf, manual, chapter) for pdf, manual, chapter, *_, done in sources if not done]
+    texts = _read_iom_pdfs(pending, pdf_text_fn)
+    written: list[tuple[Path, Path]] = []
+    for pdf_path, manual_id, chapter, doc_id, src_sha256, existing in sources:
+        if existing:
+            logger.debug("Skip (exists): %s", existing[0])
+            written.append(existing)
+            continue
+        text = next(texts)
+        if text is None:
+            continue
+        if not text.strip():
+            logger.warning("No text recovered for %s; skipping", pdf_path)
+            continue
+        meta = _meta_schema(
+            source="iom",
+            manual=manual_id,
+            chapter=chapter,
+            title=None,
+            effective_date=None,
+            source_url=None,
+            jurisdiction=None,
+            doc_id=f"iom_{manual_id}_{doc_id}",
+            src_sha256=src_sha256,
+        )
+        txt_path, meta_path = _write_doc(processed_dir, f"iom/{manual_id}", doc_id, text, meta)
+        written.append((txt_path, meta_path))
+        logger.info("Wrote %s (%d chars)", txt_path, len(text))
     return written
 
 
 # --- MCD ---
 
+# Fragments up to this size with only plain tags skip BeautifulSoup (see _simple_html_to_text).
+_SIMPLE_HTML_MAX_CHARS = 2048
+_SIMPLE_TAG_RE = re.compile(r"<(/?)([A-Za-z][A-Za-z0-9]*)[^<>\"']*>")
+_BARE_AMP_RE = re.compile(r"&(?![#\w]+;)")
+_TABLE_TAG_RE = re.compile(r"<table", re.IGNORECASE)
+# Tags whose text BeautifulSoup treats specially (tables are rewritten; the rest are dropped).
+_SOUP_ONLY_TAGS = frozenset({"table", "script", "style", "template"})
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source",
+    "track", "wbr",
+})
+
+
+def _simple_html_to_text(html: str) -> str | None:
+    """Regex fast path for :func:`_html_to_text` on short, well-nested fragments.
+
+    Returns the text BeautifulSoup would (each text node unescaped and stripped,
+    joined by newlines), or None when the fragment needs a real parser: comments,
+    quoted attributes, stray ``<`` or ``&``, unbalanced tags, or tables/scripts.
+    """
+    if len(html) > _SIMPLE_HTML_MAX_CHARS:
+        return None
+    texts: list[str] = []
+    open_tags: list[str] = []
+    pos = 0
+    for m in _SIMPLE_TAG_RE.finditer(html):
+        texts.append(html[pos : m.start()])
+        pos = m.end()
+        closing, name = m.group(1), m.group(2).lower()
+        if name in _SOUP_ONLY_TAGS:
+            return None
+        if name in _VOID_TAGS or m.group(0).endswith("/>"):
+            continue
+        if not closing:
+            open_tags.append(name)
+        elif not open_tags or open_tags.pop() != name:
+            return None
+    texts.append(html[pos:])
+    if open_tags or any("<" in t or _BARE_AMP_RE.search(t) for t in texts):
+        return None
+    stripped = (unescape(t).strip() for t in texts)
+    return "\n".join(t for t in stripped if t)
+
+
 def _html_to_text(html: str) -> str:
     """Convert HTML to plain text, preserving table rows as pipe-delimited lines."""
     if not html or not html.strip():
         return ""
-    soup = BeautifulSoup(html, "html.parser")
+    fast = _simple_html_to_text(html)
+    if fast is not None:
+        return fast
+    soup = BeautifulSoup(html, _HTML_PARSER)
     # Convert tables to pipe-delimited rows so LCD coverage criteria tables stay readable
-    for table in soup.find_all("table"):
+    # (only walk the tree for them when the markup has one).
+    tables = soup.find_all("table") if _TABLE_TAG_RE.search(html) else ()
+    for table in tables:
         rows = []
         for tr in table.find_all("tr"):
             cells = [
@@ -345,6 +570,17 @@ def _extract_mcd_zip(mcd_dir: Path, inner_zip_path: Path, subdir_name: str) -> l
     return csv_files
 
 
+def _row_value(row: list[str], columns: dict[str, int], *names: str) -> str | None:
+    """``row.get(a) or row.get(b) or ...`` for a csv.reader row and its header index."""
+    value = None
+    for name in names:
+        j = columns.get(name)
+        value = row[j] if j is not None and j < len(row) else None
+        if value:
+            return value
+    return value
+
+
 def extract_mcd(processed_dir: Path, raw_dir: Path, *, force: bool = False) -> list[tuple[Path, Path]]:
     """Extract MCD inner ZIPs (LCD, NCD, Article); parse CSV, strip HTML; one doc per row."""
     mcd_dir = raw_dir / "mcd"
@@ -378,17 +614,26 @@ def extract_mcd(processed_dir: Path, raw_dir: Path, *, force: bool = False) -> l
         for csv_path in csv_files:
             try:
                 with open(csv_path, newline="", encoding="utf-8", errors="replace") as f:
-                    reader = csv.DictReader(f)
-                    fieldnames = list(reader.fieldnames or [])
+                    reader = csv.reader(f)
+                    # Column name -> index. A repeated name keeps its first position and
+                    # its last index, matching what csv.DictReader would hand back.
+                    columns: dict[str, int] = {}
+                    for j, name in enumerate(next(reader, [])):
+                        columns[name] = j
+                    column_items = list(columns.items())
+                    fieldnames = list(columns)
                     id_col_actual = id_col if id_col in fieldnames else None
                     if not id_col_actual and fieldnames:
                         id_col_actual = (
                             next((c for c in fieldnames if "id" in c.lower() and "lcd" in c.lower()), None)
                             or next((c for c in fieldnames if "id" in c.lower()), None)
                         )
+                    id_idx = columns.get(id_col_actual or "")
                     count = 0
-                    for i, row in enumerate(reader):
-                        doc_id = row.get(id_col_actual or "", str(i)).strip() or f"row{i}"
+                    # DictReader skips blank lines without counting them; so do we.
+                    for i, row in enumerate(r for r in reader if r):
+                        raw_id = row[id_idx] if id_idx is not None and id_idx < len(row) else str(i)
+                        doc_id = raw_id.strip() or f"row{i}"
                         doc_id = re.sub(r"[^\w\-]", "_", doc_id)
                         out_txt = processed_dir / "mcd" / out_sub / f"{doc_id}.txt"
                         out_meta = processed_dir / "mcd" / out_sub / f"{doc_id}.meta.json"
@@ -397,8 +642,8 @@ def extract_mcd(processed_dir: Path, raw_dir: Path, *, force: bool = False) -> l
                             count += 1
                             continue
                         text_parts = []
-                        for k, v in row.items():
-                            part = _cell_to_text(k, v)
+                        for k, j in column_items:
+                            part = _cell_to_text(k, row[j] if j < len(row) else None)
                             if part:
                                 text_parts.append(part)
                         text = "\n\n".join(text_parts).strip()
@@ -408,10 +653,12 @@ def extract_mcd(processed_dir: Path, raw_dir: Path, *, force: bool = False) -> l
                             source="mcd",
                             manual=None,
                             chapter=None,
-                            title=row.get("Title") or row.get("LCDTitle") or row.get("ArticleTitle"),
-                            effective_date=row.get("Effective_Date") or row.get("EffectiveDate"),
-                            source_url=row.get("URL"),
-                            jurisdiction=row.get("Jurisdiction") or row.get("Contractor"),
+                            title=_row_value(row, columns, "Title", "LCDTitle", "ArticleTitle"),
+                            effective_date=_row_value(
+                                row, columns, "Effective_Date", "EffectiveDate"
+                            ),
+                            source_url=_row_value(row, columns, "URL"),
+                            jurisdiction=_row_value(row, columns, "Jurisdiction", "Contractor"),
                             doc_id=f"mcd_{out_sub}_{doc_id}",
                             **{id_meta_key: doc_id},
                         )
@@ -437,30 +684,81 @@ _HCPCS_EFF_DATE = (277, 284)
 _HCPCS_TERM_DATE = (285, 292)
 
 
+_HCPCS_MIN_LINE_LEN = 120
+# Record field -> 0-based slice of the line, built once from the 1-based layout above.
+_HCPCS_FIELD_SLICES = tuple(
+    (field, slice(start - 1, end))
+    for field, (start, end) in (
+        ("code", _HCPCS_CODE),
+        ("ric", _HCPCS_RIC),
+        ("long_desc", _HCPCS_LONG_DESC),
+        ("short_desc", _HCPCS_SHORT_DESC),
+        ("effective_date", _HCPCS_EFF_DATE),
+        ("term_date", _HCPCS_TERM_DATE),
+    )
+)
+_HCPCS_RIC_INDEX = _HCPCS_RIC[0] - 1
+_HCPCS_LONG_DESC_SLICE = slice(_HCPCS_LONG_DESC[0] - 1, _HCPCS_LONG_DESC[1])
+# RIC values that start a new code record vs. continue the previous record's long description.
+_HCPCS_RECORD_RICS = frozenset({"3", "7"})
+_HCPCS_CONTINUATION_RICS = frozenset({"4", "8"})
+_HCPCS_KEPT_RICS = _HCPCS_RECORD_RICS | _HCPCS_CONTINUATION_RICS
+
+
 def _parse_hcpcs_line(line: str) -> dict | None:
-    if len(line) < 120:
+    """Parse one fixed-width HCPCS line; None if it is too short or its RIC is never used."""
+    if len(line) < _HCPCS_MIN_LINE_LEN or line[_HCPCS_RIC_INDEX] not in _HCPCS_KEPT_RICS:
         return None
-    def slice_1based(start: int, end: int) -> str:
-        return line[start - 1 : end].strip()
-    return {
-        "code": slice_1based(*_HCPCS_CODE),
-        "ric": slice_1based(*_HCPCS_RIC),
-        "long_desc": slice_1based(*_HCPCS_LONG_DESC),
-        "short_desc": slice_1based(*_HCPCS_SHORT_DESC),
-        "effective_date": slice_1based(*_HCPCS_EFF_DATE),
-        "term_date": slice_1based(*_HCPCS_TERM_DATE),
-    }
+    return {field: line[cols].strip() for field, cols in _HCPCS_FIELD_SLICES}
+
+
+def _iter_hcpcs_records(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield one record per code from HCPCS fixed-width lines, merging continuation lines.
+
+    Only record-start lines are parsed into dicts; continuation lines contribute just
+    their long-description column, and other RICs are dismissed on the RIC byte alone.
+    """
+    current: dict | None = None
+    for line in lines:
+        if len(line) < _HCPCS_MIN_LINE_LEN:
+            continue
+        ric = line[_HCPCS_RIC_INDEX]
+        if ric in _HCPCS_RECORD_RICS:
+            if current:
+                yield current
+            current = _parse_hcpcs_line(line)
+        elif ric in _HCPCS_CONTINUATION_RICS and current:
+            extra = line[_HCPCS_LONG_DESC_SLICE].strip()
+            current["long_desc"] = (current["long_desc"] + " " + extra).strip()
+        else:
+            current = None
+    if current:
+        yield current
+
+
+def _read_hcpcs_lines(path: Path) -> list[str]:
+    """Lines of a HCPCS file, without line endings, read through a sequential mmap.
+
+    Length and RIC filtering is left to :func:`_iter_hcpcs_records`.
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            advice = getattr(mmap, "MADV_SEQUENTIAL", None)
+            if advice is not None:
+                mm.madvise(advice)
+            return [
+                raw.rstrip(b"\r\n").decode("utf-8", errors="replace")
+                for raw in iter(mm.readline, b"")
+            ]
 
 
 def _format_date_yyyymmdd(s: str) -> str | None:
     """Convert a YYYYMMDD string to YYYY-MM-DD, or None if malformed."""
-    if not s or len(s) != 8:
-        return None
-    try:
-        y, m, d = s[:4], s[4:6], s[6:8]
-        return f"{y}-{m}-{d}"
-    except (ValueError, IndexError, TypeError):
+    if len(s) != 8 or not (s.isascii() and s.isdigit()):
         return None
+    return f"{s[:4]}-{s[4:6]}-{s[6:8]}"
 
 
 def _write_hcpcs_record(
@@ -468,16 +766,20 @@ def _write_hcpcs_record(
     current: dict,
     force: bool,
     written: list[tuple[Path, Path]],
+    existing: set[str],
 ) -> None:
-    """Write a single HCPCS record to disk."""
+    """Write a single HCPCS record to disk.
+
+    existing holds the output file names already present (see :func:`_existing_outputs`)
+    and is updated with the names written here.
+    """
     doc_id = current["code"].strip()
     if not doc_id:
         return
     safe_id = re.sub(r"[^\w\-]", "_", doc_id)
-    out_txt = processed_dir / "codes" / "hcpcs" / f"{safe_id}.txt"
-    out_meta = processed_dir / "codes" / "hcpcs" / f"{safe_id}.meta.json"
-    if not force and out_txt.exists() and out_meta.exists():
-        written.append((out_txt, out_meta))
+    if not force and _has_outputs(existing, safe_id):
+        out_dir = processed_dir / "codes" / "hcpcs"
+        written.append((out_dir / f"{safe_id}.txt", out_dir / f"{safe_id}.meta.json"))
     else:
         raw_content = (
             f"Code: {current['code']}\n\n"
@@ -499,6 +801,7 @@ def _write_hcpcs_record(
         )
         txt_path, meta_path = _write_doc(processed_dir, "codes/hcpcs", safe_id, content, meta)
         written.append((txt_path, meta_path))
+        existing.update((txt_path.name, meta_path.name))
 
 
 def extract_hcpcs(processed_dir: Path, raw_dir: Path, *, force: bool = False) -> list[tuple[Path, Path]]:
@@ -508,32 +811,17 @@ def extract_hcpcs(processed_dir: Path, raw_dir: Path, *, force: bool = False) ->
         logger.warning("HCPCS raw dir not found: %s", hcpcs_base)
         return []
     written: list[tuple[Path, Path]] = []
+    existing = set() if force else _existing_outputs(processed_dir / "codes" / "hcpcs")
     for hcpcs_file in hcpcs_base.rglob("HCPC*.txt"):
         if "recordlayout" in hcpcs_file.name.lower() or "proc_notes" in hcpcs_file.name.lower():
             continue
-        current: dict | None = None
         try:
-            lines = hcpcs_file.read_text(encoding="utf-8", errors="replace").splitlines()
-        except (OSError, UnicodeDecodeError) as e:
+            lines = _read_hcpcs_lines(hcpcs_file)
+        except (OSError, ValueError) as e:
             logger.warning("HCPCS read %s: %s", hcpcs_file, e)
             continue
-        for line in lines:
-            if len(line) < 11:
-                continue
-            rec = _parse_hcpcs_line(line)
-            if not rec:
-                continue
-            ric = rec["ric"]
-            if ric in ("3", "7"):
-                if current:
-                    _write_hcpcs_record(processed_dir, current, force, written)
-                current = rec
-            elif ric in ("4", "8") and current:
-                current["long_desc"] = (current["long_desc"] + " " + rec["long_desc"]).strip()
-            else:
-                current = None
-        if current and current.get("code", "").strip():
-            _write_hcpcs_record(processed_dir, current, force, written)
+        for record in _iter_hcpcs_records(lines):
+            _write_hcpcs_record(processed_dir, record, force, written, existing)
         logger.info("HCPCS: wrote from %s", hcpcs_file.name)
     return written
 
@@ -557,6 +845,32 @@ def _first_child(elem: Element, *names: str) -> Element | None:
     return None
 
 
+def _icd10_pair(
+    elem: Element, code_names: tuple[str, ...], desc_names: tuple[str, ...]
+) -> tuple[str, str] | None:
+    """(code, description) from elem's direct children, if the code looks like ICD-10-CM."""
+    code_el = _first_child(elem, *code_names)
+    desc_el = _first_child(elem, *desc_names)
+    if code_el is None or desc_el is None:
+        return None
+    code_val = (code_el.text or "").strip()
+    desc_val = (desc_el.text or "").strip()
+    if code_val and _looks_like_icd10_code(code_val):
+        return code_val, desc_val
+    return None
+
+
+# Read size when streaming an archive member into a parser.
+_ZIP_READ_BUFFER = 1 << 20
+
+# Child tag names per layout: CDC tabular (<diag>) and generic.
+_ICD10_DIAG_NAMES = (("name",), ("desc",))
+_ICD10_GENERIC_NAMES = (
+    ("code", "codeValue", "code_value"),
+    ("desc", "description", "shortDescription"),
+)
+
+
 def _parse_icd10_xml_root(root: Element) -> list[tuple[str, str]]:
     """Return (code, description) pairs from an ICD-10-CM XML tree.
 
@@ -566,34 +880,47 @@ def _parse_icd10_xml_root(root: Element) -> list[tuple[str, str]]:
       2. Generic format: any element with ``<code>``/``<codeValue>`` and
          ``<desc>``/``<description>`` children.
     """
-    pairs: list[tuple[str, str]] = []
-
     # Strategy 1: CDC tabular (<diag> -> <name> + <desc>)
+    diags = list(root.iter("diag"))
+    if diags:
+        pairs = (_icd10_pair(diag, *_ICD10_DIAG_NAMES) for diag in diags)
+    else:
+        # Strategy 2: generic <code>/<codeValue> + <desc>/<description>
+        pairs = (_icd10_pair(elem, *_ICD10_GENERIC_NAMES) for elem in root.iter())
+    return [pair for pair in pairs if pair]
+
+
+def _parse_icd10_xml_stream(source: IO[bytes]) -> list[tuple[str, str]]:
+    """Streaming equivalent of :func:`_parse_icd10_xml_root` for an XML byte stream.
+
+    Each element's children are dropped once it closes, so memory is bounded by
+    nesting depth rather than file size. Pairs come back in document order.
+    """
+    iterparse = SafeET.iterparse if SafeET is not None else ET.iterparse
+    # (document-order index, pair); elements close child-first, so sort at the end.
+    diag_pairs: list[tuple[int, tuple[str, str]]] = []
+    generic_pairs: list[tuple[int, tuple[str, str]]] = []
     found_diag = False
-    for diag in root.iter("diag"):
-        found_diag = True
-        name_el = _first_child(diag, "name")
-        desc_el = _first_child(diag, "desc")
-        if name_el is None or desc_el is None:
+    open_order: list[int] = []
+    seen = 0
+    for event, elem in iterparse(source, events=("start", "end")):
+        if event == "start":
+            open_order.append(seen)
+            seen += 1
             continue
-        code_val = (name_el.text or "").strip()
-        desc_val = (desc_el.text or "").strip()
-        if code_val and _looks_like_icd10_code(code_val):
-            pairs.append((code_val, desc_val))
-    if found_diag:
-        return pairs
-
-    # Strategy 2: generic <code>/<codeValue> + <desc>/<description>
-    for elem in root.iter():
-        code_el = _first_child(elem, "code", "codeValue", "code_value")
-        desc_el = _first_child(elem, "desc", "description", "shortDescription")
-        if code_el is not None and desc_el is not None:
-            code_val = (code_el.text or "").strip()
-            desc_val = (desc_el.text or "").strip()
-            if code_val and _looks_like_icd10_code(code_val):
-                pairs.append((code_val, desc_val))
-
-    return pairs
+        order = open_order.pop()
+        if elem.tag == "diag":
+            found_diag = True
+            pair = _icd10_pair(elem, *_ICD10_DIAG_NAMES)
+            if pair:
+                diag_pairs.append((order, pair))
+        elif not found_diag:
+            pair = _icd10_pair(elem, *_ICD10_GENERIC_NAMES)
+            if pair:
+                generic_pairs.append((order, pair))
+        # Children were only needed for this element's own pair; its text stays for the parent.
+        del elem[:]
+    return [pair for _, pair in sorted(diag_pairs if found_diag else generic_pairs)]
 
 
 def extract_icd10cm(processed_dir: Path, raw_dir: Path, *, force: bool = False) -> list[tuple[Path, Path]]:
@@ -607,34 +934,29 @@ def extract_icd10cm(processed_dir: Path, raw_dir: Path, *, force: bool = False)
     if not icd_dir.exists():
         return []
     written: list[tuple[Path, Path]] = []
+    out_dir = processed_dir / "codes" / "icd10cm"
+    existing = set() if force else _existing_outputs(out_dir)
     for zip_path in icd_dir.glob("*.zip"):
         try:
-            root = None
             with zipfile.ZipFile(zip_path, "r") as zf:
-                xml_names = [n for n in zf.namelist() if n.lower().endswith(".xml") and "tabular" in n.lower()]
-                if not xml_names:
-                    xml_names = [n for n in zf.namelist() if n.lower().endswith(".xml")]
-                if not xml_names:
+                xml_members = [
+                    info for info in zf.infolist()
+                    if not info.is_dir() and info.filename.lower().endswith(".xml")
+                ]
+                tabular = [info for info in xml_members if "tabular" in info.filename.lower()]
+                xml_members = tabular or xml_members
+                if not xml_members:
                     logger.warning("ICD-10-CM %s: no XML files found in archive", zip_path)
                     continue
-                for xml_name in xml_names[:1]:
-                    with zf.open(xml_name) as f:
-                        if SafeET is not None:
-                            root = SafeET.parse(f).getroot()
-                        else:
-                            root = ET.parse(f).getroot()
-                    break
-            if root is None:
-                logger.warning("ICD-10-CM %s: failed to parse XML root element", zip_path)
-                continue
-
-            pairs = _parse_icd10_xml_root(root)
+                # Decompress straight into the parser in large reads; nothing touches disk.
+                with zf.open(xml_members[0]) as member, io.BufferedReader(
+                    member, buffer_size=_ZIP_READ_BUFFER
+                ) as f:
+                    pairs = _parse_icd10_xml_stream(f)
             for code_val, desc_val in pairs:
                 doc_id = re.sub(r"[^\w\-.]", "_", code_val)
-                out_txt = processed_dir / "codes" / "icd10cm" / f"{doc_id}.txt"
-                out_meta = processed_dir / "codes" / "icd10cm" / f"{doc_id}.meta.json"
-                if not force and out_txt.exists() and out_meta.exists():
-                    written.append((out_txt, out_meta))
+                if not force and _has_outputs(existing, doc_id):
+                    written.append((out_dir / f"{doc_id}.txt", out_dir / f"{doc_id}.meta.json"))
                     continue
                 raw_content = f"Code: {code_val}\n\nDescription: {desc_val}"
                 content = enrich_icd10_text(code_val, raw_content)
@@ -651,6 +973,7 @@ def extract_icd10cm(processed_dir: Path, raw_dir: Path, *, force: bool = False)
                 )
                 txt_path, meta_path = _write_doc(processed_dir, "codes/icd10cm", doc_id, content, meta)
                 written.append((txt_path, meta_path))
+                existing.update((txt_path.name, meta_path.name))
         except (zipfile.BadZipFile, ET.ParseError, OSError, ValueError) as e:
             logger.warning("ICD-10-CM %s: %s", zip_path, e)
     return written
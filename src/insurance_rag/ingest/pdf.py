@@ -0,0 +1,33 @@
+"""PDF text helpers shared by the domain extractors.
+
+PDFium (``pip install -e ".[pdfium]"``) is optional; ``pdfium`` is None when it is
+not installed and callers fall back to pdfplumber.
+"""
+
+from pathlib import Path
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+
+def pdfium_page_texts(pdf_path: Path) -> tuple[list[str], int]:
+    """Non-empty page texts and the page count of a PDF, via PDFium.
+
+    Raises ``pdfium.PdfiumError`` if PDFium cannot read the file.
+    """
+    parts = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        num_pages = len(pdf)
+        for page in pdf:
+            textpage = page.get_textpage()
+            text = textpage.get_text_range().replace("\r\n", "\n").strip()
+            textpage.close()
+            page.close()
+            if text:
+                parts.append(text)
+    finally:
+        pdf.close()
+    return parts, num_pages
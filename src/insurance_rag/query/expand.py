@@ -11,6 +11,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from insurance_rag.domains.base import SynonymScanner
+
 
 def _get_domain_patterns(domain_name: str | None = None) -> (
     tuple[dict[str, list[Any]], dict[str, str], list[tuple[Any, str]], dict[str, float]]
@@ -64,6 +66,20 @@ def detect_source_relevance(
     return scores
 
 
+def _get_domain_synonym_scanner(domain_name: str | None = None) -> SynonymScanner:
+    """The given domain's (or default's) cached synonym scanner; empty if unknown."""
+    if domain_name is None:
+        from insurance_rag.config import DEFAULT_DOMAIN
+
+        domain_name = DEFAULT_DOMAIN
+    try:
+        from insurance_rag.domains import get_domain
+
+        return get_domain(domain_name).synonym_scanner
+    except (KeyError, ImportError):
+        return SynonymScanner([])
+
+
 def _apply_synonyms(
     query: str,
     synonym_map: list[tuple[re.Pattern[str], str]] | None = None,
@@ -71,12 +87,11 @@ def _apply_synonyms(
 ) -> str:
     """Expand a query with domain synonyms."""
     if synonym_map is None:
-        _, _, synonym_map, _ = _get_domain_patterns(domain_name)
+        scanner = _get_domain_synonym_scanner(domain_name)
+    else:
+        scanner = SynonymScanner(synonym_map)
 
-    additions: list[str] = []
-    for pattern, expansion in synonym_map:
-        if pattern.search(query):
-            additions.append(expansion)
+    additions = scanner.expansions(query)
     if not additions:
         return query
     return f"{query} {' '.join(additions)}"
@@ -96,14 +111,12 @@ def expand_cross_source_query(
     followed by source-specific variants for each relevant source, and
     optionally a synonym-expanded variant.
     """
-    if source_patterns is None or source_expansions is None or synonym_map is None:
+    if source_patterns is None or source_expansions is None:
         _sp, _se, _sm, _dr = _get_domain_patterns(domain_name)
         if source_patterns is None:
             source_patterns = _sp
         if source_expansions is None:
             source_expansions = _se
-        if synonym_map is None:
-            synonym_map = _sm
         if default_relevance is None:
             default_relevance = _dr
 
@@ -117,6 +130,7 @@ def expand_cross_source_query(
             expansion = source_expansions[source]
             variants.append(f"{query} {expansion}")
 
+    # Without an explicit map, the domain's cached scanner is used.
     synonym_expanded = _apply_synonyms(query, synonym_map, domain_name)
     if synonym_expanded != query:
         variants.append(synonym_expanded)
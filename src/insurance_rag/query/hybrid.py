@@ -41,6 +41,7 @@ from insurance_rag.config import (
 from insurance_rag.index.store import get_raw_collection
 from insurance_rag.query.expand import detect_source_relevance, expand_cross_source_query
 from insurance_rag.query.retriever import (
+    _get_specialized_source_filter,
     _resolve_domain_name,
     apply_topic_summary_boost,
     expand_lcd_query,
@@ -340,14 +341,7 @@ class HybridRetriever(BaseRetriever):
                 _bm25_index.search(variant, k=fetch_k, metadata_filter=self.metadata_filter)
             )
 
-        spec_filter = None
-        resolved = _resolve_domain_name(self.domain_name)
-        try:
-            from insurance_rag.domains import get_domain
-
-            spec_filter = get_domain(resolved).get_specialized_source_filter()
-        except KeyError:
-            logger.warning("Unknown domain %r, skipping specialized source filter", resolved)
+        spec_filter = _get_specialized_source_filter(self.domain_name)
 
         if spec_filter and is_lcd_query(query, self.domain_name):
             source_filter = {**spec_filter}
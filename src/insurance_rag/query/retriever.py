@@ -10,13 +10,22 @@ match consistently regardless of query phrasing.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
+from pydantic import PrivateAttr
 
 from insurance_rag.config import LCD_RETRIEVAL_K
 from insurance_rag.index import get_embeddings, get_or_create_chroma
@@ -24,6 +33,15 @@ from insurance_rag.index.store import get_raw_collection
 
 logger = logging.getLogger(__name__)
 
+# Runs sync similarity searches so topic detection can overlap them. Shared across
+# retrievers; worker threads start lazily and are reused between queries. Each
+# invoke holds one worker for one search, so the cap bounds concurrent invokes
+# rather than work per query. concurrent.futures joins the threads at exit.
+_SEARCH_WORKERS = 4
+_SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_SEARCH_WORKERS, thread_name_prefix="retriever-search"
+)
+
 
 def _resolve_domain_name(domain_name: str | None) -> str:
     """Resolve domain name to a valid one. Falls back to DEFAULT_DOMAIN if invalid."""
@@ -43,8 +61,28 @@ def _resolve_domain_name(domain_name: str | None) -> str:
         return DEFAULT_DOMAIN
 
 
+def _get_specialized_source_filter(domain_name: str | None) -> dict[str, str] | None:
+    """Return the specialized source filter for a domain.
+
+    Cached on the domain instance, so re-registering a domain takes effect.
+    Unknown domains resolve to DEFAULT_DOMAIN first; if that is unavailable
+    too, logs and returns None. Callers must not mutate the result.
+    """
+    resolved = _resolve_domain_name(domain_name)
+    try:
+        from insurance_rag.domains import get_domain
+
+        return get_domain(resolved).specialized_source_filter
+    except KeyError:
+        logger.warning("Unknown domain %r, skipping specialized source filter", resolved)
+        return None
+
+
 def _get_domain_query_patterns(domain_name: str | None = None) -> dict[str, Any]:
-    """Load specialized query patterns from the given domain (or default)."""
+    """Load specialized query patterns from the given domain (or default).
+
+    The domain builds them once per instance; callers must not mutate the result.
+    """
     if domain_name is None:
         from insurance_rag.config import DEFAULT_DOMAIN
 
@@ -114,6 +152,10 @@ def _strip_to_medical_concept(query: str, domain_name: str | None = None) -> str
     )
 
 
+_PARENS_RE = re.compile(r"[()]+")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+
+
 def _strip_to_concept(
     query: str,
     strip_noise: re.Pattern[str] | None,
@@ -125,8 +167,8 @@ def _strip_to_concept(
         cleaned = strip_noise.sub("", cleaned)
     if strip_filler:
         cleaned = strip_filler.sub("", cleaned)
-    cleaned = re.sub(r"[()]+", " ", cleaned)
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip(" ?.,;:")
+    cleaned = _PARENS_RE.sub(" ", cleaned)
+    cleaned = _MULTI_SPACE_RE.sub(" ", cleaned).strip(" ?.,;:")
     return cleaned
 
 
@@ -142,6 +184,80 @@ def detect_query_topics(
     )
 
 
+_SUMMARY_DOC_TYPES = frozenset({"topic_summary", "document_summary"})
+_NO_TOPICS: frozenset[str] = frozenset()
+
+
+@lru_cache(maxsize=4096)
+def _parse_topic_clusters(value: str) -> frozenset[str]:
+    """Split a comma-joined ``topic_clusters`` value into a frozenset (cached)."""
+    return frozenset(t for t in value.split(",") if t)
+
+
+def _doc_topic_set(meta: dict) -> frozenset[str]:
+    """Return the multi-topic set of a doc from its ``topic_clusters``."""
+    value = meta.get("topic_clusters")
+    return _parse_topic_clusters(value) if value else _NO_TOPICS
+
+
+@dataclass
+class _MetadataView:
+    """Parallel per-field lists of the metadata keys read by the ranking stages.
+
+    Built in a single pass over a result list so that deduplication, topic
+    summary injection and boosting index plain lists instead of re-probing
+    every ``doc.metadata`` dict at each stage. Row *i* describes ``docs[i]``
+    of the list the view was built from.
+    """
+
+    doc_ids: list[str] = field(default_factory=list)
+    chunk_indices: list[int] = field(default_factory=list)
+    doc_types: list[str] = field(default_factory=list)
+    topic_clusters: list[str] = field(default_factory=list)
+    topic_clusters_multi: list[frozenset[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def append_meta(self, meta: dict) -> None:
+        self.doc_ids.append(meta.get("doc_id", ""))
+        self.chunk_indices.append(meta.get("chunk_index", 0))
+        self.doc_types.append(meta.get("doc_type", ""))
+        self.topic_clusters.append(meta.get("topic_cluster", ""))
+        self.topic_clusters_multi.append(_doc_topic_set(meta))
+
+    def append_row(self, other: _MetadataView, i: int) -> None:
+        self.doc_ids.append(other.doc_ids[i])
+        self.chunk_indices.append(other.chunk_indices[i])
+        self.doc_types.append(other.doc_types[i])
+        self.topic_clusters.append(other.topic_clusters[i])
+        self.topic_clusters_multi.append(other.topic_clusters_multi[i])
+
+    def extend(self, other: _MetadataView) -> None:
+        self.doc_ids.extend(other.doc_ids)
+        self.chunk_indices.extend(other.chunk_indices)
+        self.doc_types.extend(other.doc_types)
+        self.topic_clusters.extend(other.topic_clusters)
+        self.topic_clusters_multi.extend(other.topic_clusters_multi)
+
+    def head(self, n: int) -> _MetadataView:
+        return _MetadataView(
+            self.doc_ids[:n],
+            self.chunk_indices[:n],
+            self.doc_types[:n],
+            self.topic_clusters[:n],
+            self.topic_clusters_multi[:n],
+        )
+
+
+def _metadata_view(docs: list[Document]) -> _MetadataView:
+    """Extract the ranking metadata of *docs* into a :class:`_MetadataView`."""
+    view = _MetadataView()
+    for doc in docs:
+        view.append_meta(doc.metadata)
+    return view
+
+
 def boost_summaries(
     docs: list[Document],
     query_topics: list[str],
@@ -155,24 +271,30 @@ def boost_summaries(
     """
     if not query_topics or not docs:
         return docs[:max_k]
+    return _boost_summaries(docs, _metadata_view(docs), frozenset(query_topics), max_k)
+
+
+def _boost_summaries(
+    docs: list[Document],
+    view: _MetadataView,
+    topic_set: frozenset[str],
+    max_k: int,
+) -> list[Document]:
+    """:func:`boost_summaries` over a precomputed metadata view of *docs*."""
+    if _SUMMARY_DOC_TYPES.isdisjoint(view.doc_types):
+        return docs[:max_k]
 
-    topic_set = set(query_topics)
     boosted: list[Document] = []
     rest: list[Document] = []
 
-    for doc in docs:
-        doc_type = doc.metadata.get("doc_type", "")
-        topic_cluster = doc.metadata.get("topic_cluster", "")
-        topic_clusters = doc.metadata.get("topic_clusters", "")
-
+    for i, doc in enumerate(docs):
         is_relevant_summary = False
-        if doc_type in ("topic_summary", "document_summary"):
+        if view.doc_types[i] in _SUMMARY_DOC_TYPES:
+            topic_cluster = view.topic_clusters[i]
             if topic_cluster and topic_cluster in topic_set:
                 is_relevant_summary = True
-            elif topic_clusters:
-                doc_topics = set(topic_clusters.split(","))
-                if doc_topics & topic_set:
-                    is_relevant_summary = True
+            elif not view.topic_clusters_multi[i].isdisjoint(topic_set):
+                is_relevant_summary = True
 
         if is_relevant_summary:
             boosted.append(doc)
@@ -196,31 +318,57 @@ def inject_topic_summaries(
     """
     if not query_topics:
         return docs[:max_k]
+    combined, _ = _inject_topic_summaries(
+        store, docs, _metadata_view(docs), query_topics, max_k
+    )
+    return combined
+
+
+def _inject_topic_summaries(
+    store: Any,
+    docs: list[Document],
+    view: _MetadataView,
+    query_topics: list[str],
+    max_k: int,
+) -> tuple[list[Document], _MetadataView]:
+    """:func:`inject_topic_summaries` over a precomputed metadata view.
 
+    Returns the combined docs together with their metadata view so the
+    boosting stage can reuse it.
+    """
     ids = [f"topic_{t}" for t in query_topics]
     collection = get_raw_collection(store)
-    result = collection.get(ids=ids, include=["documents", "metadatas"])
+    # Existence check first without payload; topic summary texts are only
+    # fetched for summaries not already among the candidates.
+    stored_ids = collection.get(ids=ids, include=[]).get("ids") or []
+    existing_ids = set(view.doc_ids)
+    missing = [cid for cid in stored_ids if cid not in existing_ids]
+    if not missing:
+        return docs[:max_k], view.head(max_k)
+    result = collection.get(ids=missing, include=["documents", "metadatas"])
 
     returned_ids = result.get("ids") or []
     texts = result.get("documents") or []
     metas = result.get("metadatas") or []
 
-    injected: list[Document] = []
+    new_injected: list[Document] = []
+    new_view = _MetadataView()
     for i, _cid in enumerate(returned_ids):
         text = texts[i] if i < len(texts) else ""
-        meta = (metas[i] if i < len(metas) else None) or {}
-        injected.append(Document(page_content=text or "", metadata=dict(meta)))
-
-    existing_ids = {d.metadata.get("doc_id", "") for d in docs}
-    new_injected = [d for d in injected if d.metadata.get("doc_id", "") not in existing_ids]
+        meta = dict((metas[i] if i < len(metas) else None) or {})
+        if meta.get("doc_id", "") in existing_ids:
+            continue
+        new_injected.append(Document(page_content=text or "", metadata=meta))
+        new_view.append_meta(meta)
     if new_injected:
         logger.debug(
             "Injected %d topic summaries for query topics: %s",
             len(new_injected),
             ", ".join(query_topics),
         )
+    new_view.extend(view)
     combined = new_injected + docs
-    return combined[:max_k]
+    return combined[:max_k], new_view.head(max_k)
 
 
 def apply_topic_summary_boost(
@@ -233,36 +381,103 @@ def apply_topic_summary_boost(
     """Run topic detection, inject topic summaries if needed, boost them,
     return up to max_k docs."""
     query_topics = detect_query_topics(query, domain_name=domain_name)
+    return _boost_for_topics(store, docs, query_topics, max_k)
+
+
+def _boost_for_topics(
+    store: Any,
+    docs: list[Document],
+    query_topics: list[str],
+    max_k: int,
+) -> list[Document]:
+    """:func:`apply_topic_summary_boost` with topics detected by the caller."""
     if query_topics:
-        docs = inject_topic_summaries(store, docs, query_topics, max_k)
-        docs = boost_summaries(docs, query_topics, max_k)
+        return _boost_with_topics(store, docs, _metadata_view(docs), query_topics, max_k)
     return docs[:max_k]
 
 
+def _boost_with_topics(
+    store: Any,
+    docs: list[Document],
+    view: _MetadataView,
+    query_topics: list[str],
+    max_k: int,
+) -> list[Document]:
+    """Inject and boost topic summaries for already-detected *query_topics*."""
+    docs, view = _inject_topic_summaries(store, docs, view, query_topics, max_k)
+    return _boost_summaries(docs, view, frozenset(query_topics), max_k)
+
+
 def _deduplicate_docs(
     doc_lists: list[list[Document]],
     max_k: int,
 ) -> list[Document]:
     """Merge doc lists via round-robin interleaving, deduplicating by
     doc_id+chunk_index."""
-    seen: set[str] = set()
+    merged, _ = _merge_round_robin(
+        doc_lists, [_metadata_view(dl) for dl in doc_lists], max_k
+    )
+    return merged
+
+
+def _add_unique_keys(seen: set[tuple[str, int]], view: _MetadataView) -> int:
+    """Add the doc_id+chunk_index keys of *view* to *seen*; return the new size."""
+    seen.update(zip(view.doc_ids, view.chunk_indices, strict=True))
+    return len(seen)
+
+
+def _specialized_fetch_order(n: int) -> list[int]:
+    """Indices of *n* planned specialized searches in fetch order: the
+    source-filtered and base searches first, then the expanded variants."""
+    return [0, n - 1, *range(1, n - 1)] if n > 1 else [0]
+
+
+def _merge_until_saturated(
+    results: Iterable[tuple[int, list[Document]]], max_k: int
+) -> tuple[list[Document], _MetadataView]:
+    """Round-robin merge ``(search index, docs)`` results taken in fetch order.
+
+    Results stop being taken once *max_k* unique docs are in hand; the taken
+    lists are interleaved in search-index order.
+    """
+    fetched: dict[int, tuple[list[Document], _MetadataView]] = {}
+    seen: set[tuple[str, int]] = set()
+    for idx, docs in results:
+        view = _metadata_view(docs)
+        fetched[idx] = (docs, view)
+        if _add_unique_keys(seen, view) >= max_k:
+            break
+    ordered = [fetched[i] for i in sorted(fetched)]
+    return _merge_round_robin(
+        [docs for docs, _ in ordered], [view for _, view in ordered], max_k
+    )
+
+
+def _merge_round_robin(
+    doc_lists: list[list[Document]],
+    views: list[_MetadataView],
+    max_k: int,
+) -> tuple[list[Document], _MetadataView]:
+    """:func:`_deduplicate_docs` over per-list metadata views.
+
+    Returns the merged docs and their metadata view.
+    """
+    seen: set[tuple[str, int]] = set()
     merged: list[Document] = []
+    merged_view = _MetadataView()
     max_len = max((len(dl) for dl in doc_lists), default=0)
     for pos in range(max_len):
-        for dl in doc_lists:
+        for dl, view in zip(doc_lists, views, strict=True):
             if pos >= len(dl):
                 continue
-            doc = dl[pos]
-            key = (
-                f"{doc.metadata.get('doc_id', '')}"
-                f"\x00{doc.metadata.get('chunk_index', 0)}"
-            )
+            key = (view.doc_ids[pos], view.chunk_indices[pos])
             if key not in seen:
                 seen.add(key)
-                merged.append(doc)
+                merged.append(dl[pos])
+                merged_view.append_row(view, pos)
                 if len(merged) >= max_k:
-                    return merged
-    return merged
+                    return merged, merged_view
+    return merged, merged_view
 
 
 class LCDAwareRetriever(BaseRetriever):
@@ -271,7 +486,11 @@ class LCDAwareRetriever(BaseRetriever):
 
     For non-specialized queries, delegates to standard similarity search.
     For specialized queries (e.g. LCD in Medicare, coverage in Auto), runs
-    multi-variant source-filtered searches and merges results.
+    multi-variant source-filtered searches and merges results; expanded
+    variant searches are skipped once ``lcd_k`` unique docs are already in
+    hand. Async invocation (``ainvoke``) issues all searches concurrently
+    via the store's ``asimilarity_search`` and merges them with the same
+    cutoff, so both paths return the same docs.
 
     Alias: :class:`DomainAwareRetriever` for domain-agnostic usage.
     """
@@ -284,6 +503,26 @@ class LCDAwareRetriever(BaseRetriever):
     metadata_filter: dict | None = None
     domain_name: str | None = None
 
+    # Derived once from metadata_filter and the domain's specialized source
+    # filter; both are fixed for the lifetime of a retriever instance.
+    _source_filter: dict = PrivateAttr(default_factory=dict)
+    _skip_specialized: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, context: Any, /) -> None:
+        super().model_post_init(context)
+        spec_filter = _get_specialized_source_filter(self.domain_name)
+
+        if spec_filter and self.metadata_filter is not None:
+            req_source = spec_filter.get("source")
+            self._skip_specialized = bool(req_source) and self.metadata_filter.get(
+                "source"
+            ) not in (None, req_source)
+
+        source_filter = dict(spec_filter or {})
+        if self.metadata_filter is not None:
+            source_filter = {**self.metadata_filter, **source_filter}
+        self._source_filter = source_filter
+
     def _get_relevant_documents(
         self,
         query: str,
@@ -295,65 +534,112 @@ class LCDAwareRetriever(BaseRetriever):
         search_kwargs: dict = {"k": self.k}
         if self.metadata_filter is not None:
             search_kwargs["filter"] = self.metadata_filter
-        docs = self.store.similarity_search(query, **search_kwargs)
-        docs = apply_topic_summary_boost(
-            self.store, docs, query, self.k, domain_name=self.domain_name
-        )
-        return docs
-
-    def _specialized_retrieve(self, query: str) -> list[Document]:
-        spec_filter = None
-        resolved = _resolve_domain_name(self.domain_name)
+        # Topic detection depends only on the query text, so it runs on this
+        # thread while the similarity search is in flight.
+        search = _SEARCH_EXECUTOR.submit(self.store.similarity_search, query, **search_kwargs)
         try:
-            from insurance_rag.domains import get_domain
+            query_topics = detect_query_topics(query, domain_name=self.domain_name)
+            docs = search.result()
+        finally:
+            # No-op once the search has finished; drops it if detection raised
+            # before a worker picked it up.
+            search.cancel()
+        return _boost_for_topics(self.store, docs, query_topics, self.k)
+
+    async def _aget_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: AsyncCallbackManagerForRetrieverRun,
+    ) -> list[Document]:
+        if is_lcd_query(query, self.domain_name):
+            return await self._aspecialized_retrieve(query)
+        search_kwargs: dict = {"k": self.k}
+        if self.metadata_filter is not None:
+            search_kwargs["filter"] = self.metadata_filter
+        # Topic detection runs in a worker thread so it overlaps the search.
+        docs, query_topics = await asyncio.gather(
+            self.store.asimilarity_search(query, **search_kwargs),
+            asyncio.to_thread(detect_query_topics, query, domain_name=self.domain_name),
+        )
+        if not query_topics:
+            return docs[: self.k]
+        # Summary injection hits the sync Chroma client.
+        return await asyncio.to_thread(
+            _boost_for_topics, self.store, docs, query_topics, self.k
+        )
 
-            spec_filter = get_domain(resolved).get_specialized_source_filter()
-        except KeyError:
-            logger.warning("Unknown domain %r, skipping specialized source filter", resolved)
+    def _specialized_searches(
+        self, query: str
+    ) -> tuple[list[tuple[str, dict]], bool]:
+        """Plan the similarity searches for a specialized query.
 
-        if spec_filter and self.metadata_filter is not None:
-            req_source = spec_filter.get("source")
-            if req_source and self.metadata_filter.get("source") not in (
-                None,
-                req_source,
-            ):
-                search_kwargs = {"k": self.k, "filter": self.metadata_filter}
-                return self.store.similarity_search(query, **search_kwargs)
-
-        source_filter = spec_filter or {}
-        if self.metadata_filter is not None:
-            source_filter = {**self.metadata_filter, **source_filter}
+        Returns ``(searches, merge)`` where *searches* is a list of
+        ``(query, search_kwargs)`` pairs in merge order. When *merge* is
+        False the caller's metadata filter excludes the specialized source
+        and the single planned search is returned as-is.
+        """
+        if self._skip_specialized:
+            return [(query, {"k": self.k, "filter": self.metadata_filter})], False
 
+        source_filter = self._source_filter
         per_variant = max(4, self.lcd_k // 3)
+        searches: list[tuple[str, dict]] = []
 
         if source_filter:
-            spec_docs = self.store.similarity_search(
-                query, k=per_variant, filter=source_filter
-            )
+            searches.append((query, {"k": per_variant, "filter": source_filter}))
             expanded_queries = expand_lcd_query(query, self.domain_name)
-            variant_results: list[list[Document]] = []
             for eq in expanded_queries[1:]:
-                variant_results.append(
-                    self.store.similarity_search(
-                        eq, k=per_variant, filter=source_filter,
-                    )
-                )
-        else:
-            spec_docs = []
-            expanded_queries = expand_lcd_query(query, self.domain_name)
-            variant_results = []
+                searches.append((eq, {"k": per_variant, "filter": source_filter}))
 
         base_kwargs: dict = {"k": per_variant}
         if self.metadata_filter is not None:
             base_kwargs["filter"] = self.metadata_filter
-        base_docs = self.store.similarity_search(query, **base_kwargs)
+        searches.append((query, base_kwargs))
+        return searches, True
 
-        doc_lists = [spec_docs] + variant_results + [base_docs]
-        merged = _deduplicate_docs(doc_lists, max_k=self.lcd_k)
-        merged = apply_topic_summary_boost(
-            self.store, merged, query, self.lcd_k, domain_name=self.domain_name
+    def _specialized_retrieve(self, query: str) -> list[Document]:
+        searches, merge = self._specialized_searches(query)
+        if not merge:
+            q, kw = searches[0]
+            return self.store.similarity_search(q, **kw)
+
+        # The source-filtered and base searches run first; expanded variants
+        # are only issued while the candidate pool is short of lcd_k unique
+        # docs. Fetched lists are still interleaved in their planned order.
+        def fetch() -> Iterator[tuple[int, list[Document]]]:
+            for idx in _specialized_fetch_order(len(searches)):
+                q, kw = searches[idx]
+                yield idx, self.store.similarity_search(q, **kw)
+
+        merged, view = _merge_until_saturated(fetch(), self.lcd_k)
+        return self._boost_merged(merged, view, query)
+
+    async def _aspecialized_retrieve(self, query: str) -> list[Document]:
+        searches, merge = self._specialized_searches(query)
+        doc_lists = list(
+            await asyncio.gather(
+                *(self.store.asimilarity_search(q, **kw) for q, kw in searches)
+            )
         )
-        return merged
+        if not merge:
+            return doc_lists[0]
+
+        # Same cutoff as the sync path, applied after the concurrent fetch.
+        merged, view = _merge_until_saturated(
+            ((i, doc_lists[i]) for i in _specialized_fetch_order(len(doc_lists))),
+            self.lcd_k,
+        )
+        return await asyncio.to_thread(self._boost_merged, merged, view, query)
+
+    def _boost_merged(
+        self, merged: list[Document], view: _MetadataView, query: str
+    ) -> list[Document]:
+        """Apply topic-summary boosting to a merged specialized result set."""
+        query_topics = detect_query_topics(query, domain_name=self.domain_name)
+        if not query_topics:
+            return merged[: self.lcd_k]
+        return _boost_with_topics(self.store, merged, view, query_topics, self.lcd_k)
 
 
 DomainAwareRetriever = LCDAwareRetriever  # Alias for domain-agnostic usage
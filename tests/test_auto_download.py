@@ -1,12 +1,16 @@
 """Tests for auto insurance download scripts."""
+import asyncio
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from insurance_rag.domains.auto.download import (
     CLAIMS_URLS,
+    DOWNLOAD_CONCURRENCY,
     FORMS_URLS,
     RATES_URLS,
     REGULATIONS_URLS,
@@ -32,31 +36,43 @@ def tmp_raw(tmp_path: Path) -> Path:
     return tmp_path / "raw"
 
 
-def _make_stream_cm(content: bytes = PDF_CONTENT):
-    r = MagicMock()
-    r.raise_for_status = MagicMock()
-    r.iter_bytes = MagicMock(return_value=iter([content]))
-    cm = MagicMock()
-    cm.__enter__ = MagicMock(return_value=r)
-    cm.__exit__ = MagicMock(return_value=False)
-    return cm
+@pytest.fixture(autouse=True)
+def serial_extract(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Extract in-process so module-level pdfplumber patches apply."""
+    monkeypatch.setattr("insurance_rag.domains.auto.extract.EXTRACT_WORKERS", 1)
 
 
-def test_download_regulations_naic_models(tmp_raw: Path) -> None:
-    """download_regulations downloads NAIC model law PDFs and writes manifest."""
-    with patch("insurance_rag.domains.auto.download.httpx") as mock_httpx:
-        mock_client = MagicMock()
-        mock_client.stream.side_effect = lambda *a, **k: _make_stream_cm()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_httpx.Client.return_value = mock_client
+def _serve(request: httpx.Request) -> httpx.Response:
+    """PDF bytes for .pdf paths, an HTML page otherwise."""
+    if request.url.path.lower().endswith(".pdf"):
+        return httpx.Response(200, content=PDF_CONTENT)
+    return httpx.Response(200, content=HTML_CONTENT.encode())
+
+
+@pytest.fixture
+def seen() -> list[httpx.URL]:
+    """URLs requested through the transport fixture."""
+    return []
+
+
+@pytest.fixture
+def transport(seen: list[httpx.URL]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url)
+        return _serve(request)
+
+    return httpx.MockTransport(handler)
 
-        download_regulations(tmp_raw, force=True)
+
+def test_download_regulations_naic_models(tmp_raw: Path, transport: httpx.MockTransport) -> None:
+    """download_regulations downloads NAIC model law PDFs and writes manifest."""
+    download_regulations(tmp_raw, force=True, transport=transport)
 
     naic_dir = tmp_raw / "regulations" / "naic"
     assert naic_dir.exists()
     pdfs = list(naic_dir.glob("*.pdf"))
     assert len(pdfs) == len(REGULATIONS_URLS)
+    assert all(p.read_bytes() == PDF_CONTENT for p in pdfs)
     manifest = naic_dir / "manifest.json"
     assert manifest.exists()
     manifest_text = manifest.read_text()
@@ -64,7 +80,63 @@ def test_download_regulations_naic_models(tmp_raw: Path) -> None:
     assert "naic" in manifest_text.lower() or "content.naic" in manifest_text
 
 
-def test_regulations_idempotency(tmp_raw: Path) -> None:
+def test_download_regulations_concurrent_and_bounded(tmp_raw: Path) -> None:
+    """Regulation URLs are fetched concurrently, capped at DOWNLOAD_CONCURRENCY in flight."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _serve(request)
+
+    download_regulations(tmp_raw, force=True, transport=httpx.MockTransport(slow_handler))
+
+    assert 1 < peak <= DOWNLOAD_CONCURRENCY
+    manifest = json.loads((tmp_raw / "regulations" / "naic" / "manifest.json").read_text())
+    assert [f["path"] for f in manifest["files"]] == [f"{k}.pdf" for k in REGULATIONS_URLS]
+
+
+def test_download_regulations_inside_running_loop(
+    tmp_raw: Path, transport: httpx.MockTransport
+) -> None:
+    """download_regulations works when called from code already running an event loop."""
+
+    async def caller() -> None:
+        download_regulations(tmp_raw, force=True, transport=transport)
+
+    asyncio.run(caller())
+
+    naic_dir = tmp_raw / "regulations" / "naic"
+    assert len(list(naic_dir.glob("*.pdf"))) == len(REGULATIONS_URLS)
+    assert (naic_dir / "manifest.json").exists()
+
+
+def test_download_skips_404(tmp_raw: Path) -> None:
+    """A 404 skips that file (no partial file, not in manifest) without failing the rest."""
+    missing = next(iter(REGULATIONS_URLS))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url) == REGULATIONS_URLS[missing]:
+            return httpx.Response(404)
+        return _serve(request)
+
+    download_regulations(tmp_raw, force=True, transport=httpx.MockTransport(handler))
+
+    naic_dir = tmp_raw / "regulations" / "naic"
+    assert not (naic_dir / f"{missing}.pdf").exists()
+    assert not list(naic_dir.glob("*.part"))
+    manifest = json.loads((naic_dir / "manifest.json").read_text())
+    assert f"{missing}.pdf" not in [f["path"] for f in manifest["files"]]
+    assert len(manifest["files"]) == len(REGULATIONS_URLS) - 1
+
+
+def test_regulations_idempotency(
+    tmp_raw: Path, transport: httpx.MockTransport, seen: list[httpx.URL]
+) -> None:
     """When all regulation files exist and force=False, download_regulations skips re-download."""
     naic_dir = tmp_raw / "regulations" / "naic"
     naic_dir.mkdir(parents=True)
@@ -74,44 +146,75 @@ def test_regulations_idempotency(tmp_raw: Path) -> None:
         '{"source_url": "x", "files": [{"path": "mo-725.pdf", "file_hash": null}]}'
     )
 
-    stream_calls: list = []
+    with patch("insurance_rag.domains.auto.download._async_client") as mock_new_client:
+        download_regulations(tmp_raw, force=False)
+        download_regulations(tmp_raw, force=False, transport=transport)
+
+    assert seen == [], "Should not re-download when all files exist"
+    mock_new_client.assert_not_called()
 
-    def track_stream(*args, **kwargs):
-        stream_calls.append(args)
-        return _make_stream_cm()
 
-    with patch("insurance_rag.domains.auto.download.httpx") as mock_httpx:
-        mock_client = MagicMock()
-        mock_client.stream.side_effect = track_stream
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_httpx.Client.return_value = mock_client
+def test_regulations_manifest_urlset_short_circuit(
+    tmp_raw: Path, transport: httpx.MockTransport, seen: list[httpx.URL]
+) -> None:
+    """A manifest recorded for the same URL set skips hashing and the manifest rewrite."""
+    download_regulations(tmp_raw, force=True, transport=transport)
 
-        download_regulations(tmp_raw, force=False)
+    manifest_path = tmp_raw / "regulations" / "naic" / "manifest.json"
+    assert json.loads(manifest_path.read_text())["urlset_hash"]
+    mtime_ns = manifest_path.stat().st_mtime_ns
+    seen.clear()
 
-    assert len(stream_calls) == 0, "Should not re-download when all files exist"
+    with patch("insurance_rag.domains.auto.download.file_sha256") as mock_hash:
+        download_regulations(tmp_raw, force=False, transport=transport)
 
+    assert seen == []
+    mock_hash.assert_not_called()
+    assert manifest_path.stat().st_mtime_ns == mtime_ns
+
+    # A missing file falls back to the normal fetch path.
+    first = next(iter(REGULATIONS_URLS))
+    (manifest_path.parent / f"{first}.pdf").unlink()
+    download_regulations(tmp_raw, force=False, transport=transport)
+    assert [str(url) for url in seen] == [REGULATIONS_URLS[first]]
 
-def test_download_forms_state_guides(tmp_raw: Path) -> None:
-    """download_forms downloads state/NAIC guides (PDF and HTML) and writes manifest."""
-    def fake_stream(*args, **kwargs):
-        return _make_stream_cm(PDF_CONTENT)
 
-    def fake_get(url, **kwargs):
-        r = MagicMock()
-        r.raise_for_status = MagicMock()
-        r.text = HTML_CONTENT
-        return r
+def test_regulations_forced_redownload_refreshes_download_date(
+    tmp_raw: Path, transport: httpx.MockTransport
+) -> None:
+    """A forced re-download of identical content still records the new download_date."""
+    manifest_path = tmp_raw / "regulations" / "naic" / "manifest.json"
+    with patch("insurance_rag.download._manifest.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2024, 1, 1, tzinfo=UTC)
+        download_regulations(tmp_raw, force=True, transport=transport)
+        first = json.loads(manifest_path.read_text())
+        mock_dt.now.return_value = datetime(2024, 2, 1, tzinfo=UTC)
+        download_regulations(tmp_raw, force=True, transport=transport)
+    second = json.loads(manifest_path.read_text())
 
-    with patch("insurance_rag.domains.auto.download.httpx") as mock_httpx:
-        mock_client = MagicMock()
-        mock_client.stream.side_effect = fake_stream
-        mock_client.get.side_effect = fake_get
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_httpx.Client.return_value = mock_client
+    assert second["files"] == first["files"]
+    assert first["download_date"].startswith("2024-01-01")
+    assert second["download_date"].startswith("2024-02-01")
 
-        download_forms(tmp_raw, force=True)
+
+def test_regulations_unfetched_matching_manifest_kept(tmp_raw: Path) -> None:
+    """When a retry fetches nothing and the manifest already matches, it is left as is."""
+    missing = next(iter(REGULATIONS_URLS))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url) == REGULATIONS_URLS[missing]:
+            return httpx.Response(404)
+        return _serve(request)
+
+    download_regulations(tmp_raw, force=True, transport=httpx.MockTransport(handler))
+    with patch("insurance_rag.domains.auto.download.write_manifest") as mock_write:
+        download_regulations(tmp_raw, force=False, transport=httpx.MockTransport(handler))
+    mock_write.assert_not_called()
+
+
+def test_download_forms_state_guides(tmp_raw: Path, transport: httpx.MockTransport) -> None:
+    """download_forms downloads state/NAIC guides (PDF and HTML) and writes manifest."""
+    download_forms(tmp_raw, force=True, transport=transport)
 
     forms_dir = tmp_raw / "forms"
     assert forms_dir.exists()
@@ -125,6 +228,7 @@ def test_download_forms_state_guides(tmp_raw: Path) -> None:
     pdf_count = len(list(forms_dir.rglob("*.pdf")))
     html_count = len(list(forms_dir.rglob("*.html")))
     assert pdf_count + html_count == len(FORMS_URLS)
+    assert (forms_dir / "TX" / "cb020.html").read_text(encoding="utf-8") == HTML_CONTENT
 
 
 def test_forms_idempotency(tmp_raw: Path) -> None:
@@ -134,49 +238,20 @@ def test_forms_idempotency(tmp_raw: Path) -> None:
     ca_filename = sanitize_filename_from_url(FORMS_URLS["CA"], "guide.pdf")
     ca_file = ca_dir / ca_filename
     ca_file.write_bytes(PDF_CONTENT)
-    original_size = ca_file.stat().st_size
-
-    def fake_stream(*args, **kwargs):
-        return _make_stream_cm(b"%PDF other content")
-
-    def fake_get(url, **kwargs):
-        r = MagicMock()
-        r.raise_for_status = MagicMock()
-        r.text = HTML_CONTENT
-        return r
 
-    with patch("insurance_rag.domains.auto.download.httpx") as mock_httpx:
-        mock_client = MagicMock()
-        mock_client.stream.side_effect = fake_stream
-        mock_client.get.side_effect = fake_get
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_httpx.Client.return_value = mock_client
-
-        download_forms(tmp_raw, force=False)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"%PDF other"))
+    download_forms(tmp_raw, force=False, transport=transport)
 
     assert ca_file.exists()
-    assert ca_file.read_bytes() == PDF_CONTENT, "Existing file should not be overwritten when force=False"
+    assert ca_file.read_bytes() == PDF_CONTENT, (
+        "Existing file should not be overwritten when force=False"
+    )
 
 
-def test_download_claims_and_rates(tmp_raw: Path) -> None:
+def test_download_claims_and_rates(tmp_raw: Path, transport: httpx.MockTransport) -> None:
     """download_claims and download_rates run and write manifests (thin sources)."""
-    def fake_get(url, **kwargs):
-        r = MagicMock()
-        r.raise_for_status = MagicMock()
-        r.text = HTML_CONTENT
-        return r
-
-    with patch("insurance_rag.domains.auto.download.httpx") as mock_httpx:
-        mock_client = MagicMock()
-        mock_client.get.side_effect = fake_get
-        mock_client.stream.side_effect = lambda *a, **k: _make_stream_cm()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_httpx.Client.return_value = mock_client
-
-        download_claims(tmp_raw, force=True)
-        download_rates(tmp_raw, force=True)
+    download_claims(tmp_raw, force=True, transport=transport)
+    download_rates(tmp_raw, force=True, transport=transport)
 
     claims_dir = tmp_raw / "claims"
     assert claims_dir.exists()
@@ -326,3 +401,81 @@ def test_extract_idempotency(tmp_path: Path) -> None:
 
     assert len(written) == 1
     assert written[0][0].read_text() == "existing content", "Existing file should not be overwritten when force=False"
+
+
+def test_extract_forms_process_pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """With EXTRACT_WORKERS > 1, files are extracted in worker processes; output order is stable."""
+    monkeypatch.setattr("insurance_rag.domains.auto.extract.EXTRACT_WORKERS", 2)
+    raw = tmp_path / "raw"
+    processed = tmp_path / "processed"
+    for state in ("CA", "TX", "IL"):
+        state_dir = raw / "forms" / state
+        state_dir.mkdir(parents=True)
+        (state_dir / "guide.html").write_text(
+            f"<html><body><p>{state} auto guide</p></body></html>", encoding="utf-8"
+        )
+
+    written = extract_forms(processed, raw, force=True)
+
+    assert [p.parent.name for p, _ in written] == ["CA", "IL", "TX"]
+    assert "IL auto guide" in written[1][0].read_text()
+
+
+def test_read_source_texts_bounds_read_ahead(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The pool never has more than EXTRACT_WORKERS * 2 sources submitted ahead of the consumer."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from insurance_rag.domains.auto import extract as auto_extract
+
+    submitted: list[Path] = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            submitted.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(auto_extract, "EXTRACT_WORKERS", 2)
+    monkeypatch.setattr(auto_extract, "ProcessPoolExecutor", RecordingExecutor)
+    paths = []
+    for i in range(10):
+        path = tmp_path / f"guide{i}.html"
+        path.write_text(f"<html><body><p>guide {i}</p></body></html>", encoding="utf-8")
+        paths.append(path)
+
+    texts = auto_extract._read_source_texts(paths)
+    assert next(texts) == "guide 0"
+    assert len(submitted) == 5
+    assert list(texts) == [f"guide {i}" for i in range(1, 10)]
+    assert submitted == paths
+
+
+def test_extract_html_text_selectolax_matches_bs4(tmp_path: Path) -> None:
+    """The selectolax fast path drops the same boilerplate tags as the BeautifulSoup path."""
+    pytest.importorskip("selectolax")
+    from insurance_rag.domains.auto import extract as auto_extract
+
+    html_path = tmp_path / "guide.html"
+    html_path.write_text(
+        "<html><head><style>p{}</style></head><body><nav>Menu</nav>"
+        "<p>Auto claim tips</p><script>x()</script><p>File promptly</p></body></html>",
+        encoding="utf-8",
+    )
+    fast = auto_extract._extract_html_text(html_path)
+    with patch.object(auto_extract, "HTMLParser", None):
+        slow = auto_extract._extract_html_text(html_path)
+    assert fast == slow == "Auto claim tips\nFile promptly"
+
+
+def test_extract_pdf_text_uses_pdfium(tmp_path: Path, minimal_pdf) -> None:
+    """With pypdfium2 installed, readable PDFs are extracted without pdfplumber."""
+    pytest.importorskip("pypdfium2")
+    from insurance_rag.domains.auto import extract as auto_extract
+
+    pdf_path = tmp_path / "mo-710.pdf"
+    pdf_path.write_bytes(minimal_pdf("Model law 710 content."))
+    with patch("insurance_rag.domains.auto.extract.pdfplumber") as mock_plumber:
+        text = auto_extract._extract_pdf_text(pdf_path)
+    assert text == "Model law 710 content."
+    mock_plumber.open.assert_not_called()
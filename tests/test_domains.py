@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from insurance_rag.domains import get_domain, list_domains
+from insurance_rag.domains import _BUILTIN_DOMAINS, get_domain, list_domains
 from insurance_rag.domains.base import InsuranceDomain
 
 
@@ -24,6 +24,9 @@ class TestDomainRegistry:
         domain = get_domain("medicare")
         assert isinstance(domain, InsuranceDomain)
 
+    def test_get_domain_returns_shared_instance(self):
+        assert get_domain("auto") is get_domain("auto")
+
     def test_get_unknown_domain_raises(self):
         with pytest.raises(KeyError, match="Unknown domain"):
             get_domain("nonexistent_domain_xyz")
@@ -32,6 +35,14 @@ class TestDomainRegistry:
         domains = list_domains()
         assert domains == sorted(domains)
 
+    def test_builtin_import_error_is_logged(self, monkeypatch, caplog):
+        monkeypatch.setitem(
+            _BUILTIN_DOMAINS, "broken_xyz", "insurance_rag.domains.broken_xyz:BrokenDomain"
+        )
+        with pytest.raises(KeyError, match="Unknown domain"):
+            get_domain("broken_xyz")
+        assert "insurance_rag.domains.broken_xyz" in caplog.text
+
 
 class TestInsuranceDomainInterface:
     """Ensure all registered domains implement the full interface."""
@@ -83,6 +94,18 @@ class TestInsuranceDomainInterface:
             assert "name" in topic
             assert "patterns" in topic
 
+    def test_topic_definitions_loaded_once(
+        self, domain: InsuranceDomain, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        path = tmp_path / "topics.json"
+        path.write_text('[{"name": "t", "patterns": ["x"]}]', encoding="utf-8")
+        fresh = type(domain)()
+        monkeypatch.setattr(fresh, "get_topic_definitions_path", lambda: path)
+        first = fresh.topic_definitions
+        assert first == [{"name": "t", "patterns": ["x"]}]
+        path.unlink()
+        assert fresh.topic_definitions is first
+
     def test_get_query_patterns(self, domain: InsuranceDomain):
         patterns = domain.get_query_patterns()
         assert isinstance(patterns, dict)
@@ -92,6 +115,9 @@ class TestInsuranceDomainInterface:
             isinstance(p, re.Pattern) for p in patterns["specialized_query_patterns"]
         )
 
+    def test_get_query_patterns_built_once(self, domain: InsuranceDomain):
+        assert domain.get_query_patterns() is domain.get_query_patterns()
+
     def test_get_source_patterns(self, domain: InsuranceDomain):
         sp = domain.get_source_patterns()
         assert isinstance(sp, dict)
@@ -113,6 +139,13 @@ class TestInsuranceDomainInterface:
             assert isinstance(pattern, re.Pattern)
             assert isinstance(expansion, str)
 
+    def test_synonym_scanner_matches_per_pattern_search(self, domain: InsuranceDomain):
+        sm = domain.get_synonym_map()
+        scanner = domain.synonym_scanner
+        for text in ["nothing relevant here", "coverage and billing", "PIP or collision"]:
+            expected = [exp for pattern, exp in sm if pattern.search(text)]
+            assert scanner.expansions(text) == expected
+
     def test_get_system_prompt(self, domain: InsuranceDomain):
         prompt = domain.get_system_prompt()
         assert isinstance(prompt, str)
@@ -4,10 +4,20 @@ import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
-from insurance_rag.download._manifest import file_sha256, write_manifest
-from insurance_rag.download._utils import sanitize_filename_from_url, stream_download
+from insurance_rag.download._manifest import (
+    file_sha256,
+    manifest_matches,
+    read_manifest,
+    write_manifest,
+)
+from insurance_rag.download._utils import (
+    sanitize_filename_from_url,
+    stream_download,
+    write_if_changed,
+)
 from insurance_rag.download.codes import download_codes
 from insurance_rag.download.iom import download_iom
 from insurance_rag.download.mcd import _safe_extract_zip, download_mcd
@@ -41,6 +51,33 @@ def test_manifest_write_and_file_sha256(tmp_path: Path) -> None:
     assert len(h) == 64 and all(c in "0123456789abcdef" for c in h)
 
 
+def test_manifest_matches_ignores_download_date(tmp_path: Path) -> None:
+    """Identical content matches whatever its download_date; changed hashes do not."""
+    (tmp_path / "a.txt").write_text("hello")
+    manifest = tmp_path / "manifest.json"
+    files = [(tmp_path / "a.txt", "abc")]
+    assert not manifest_matches(manifest, "https://example.com/source", files, base_dir=tmp_path)
+    write_manifest(manifest, "https://example.com/source", files, base_dir=tmp_path)
+    assert manifest_matches(manifest, "https://example.com/source", files, base_dir=tmp_path)
+
+    changed = [(tmp_path / "a.txt", "def")]
+    assert not manifest_matches(manifest, "https://example.com/source", changed, base_dir=tmp_path)
+    write_manifest(manifest, "https://example.com/source", changed, base_dir=tmp_path)
+    assert read_manifest(manifest)["files"] == [{"path": "a.txt", "file_hash": "def"}]
+
+
+def test_write_if_changed(tmp_path: Path) -> None:
+    """Identical bytes are not rewritten; new or changed content is."""
+    path = tmp_path / "meta.json"
+    assert write_if_changed(path, b'{"a": 1}')
+    mtime = path.stat().st_mtime_ns
+    assert not write_if_changed(path, b'{"a": 1}')
+    assert path.stat().st_mtime_ns == mtime
+    assert write_if_changed(path, b'{"a": 2}')
+    assert path.read_bytes() == b'{"a": 2}'
+    assert not (tmp_path / "meta.json.part").exists()
+
+
 def test_mcd_download(tmp_raw: Path) -> None:
     zip_content = _minimal_zip_bytes()
     mock_stream_response = MagicMock()
@@ -357,6 +394,14 @@ def test_sanitize_filename_from_url_empty_and_query() -> None:
     assert sanitize_filename_from_url("https://example.com?", "fallback") == "fallback"
 
 
+def test_sanitize_filename_from_url_fragment_and_bare_host() -> None:
+    """Fragments and ;params are stripped; a host with no path returns default."""
+    assert sanitize_filename_from_url("https://example.com/a/file.pdf#page=2", "d") == "file.pdf"
+    assert sanitize_filename_from_url("https://example.com/a/file.pdf;sid=1", "d") == "file.pdf"
+    assert sanitize_filename_from_url("https://example.com", "d") == "d"
+    assert sanitize_filename_from_url("not-a-url", "d") == "d"
+
+
 def test_sanitize_filename_from_url_rejects_control_chars() -> None:
     """Percent-encoded NUL or other control chars in basename are rejected (filesystem safety)."""
     # %00 -> NUL
@@ -406,6 +451,29 @@ def test_stream_download_accepts_http_and_https(tmp_path: Path) -> None:
     assert dest.read_bytes() == b"ok"
 
 
+def test_stream_download_failure_keeps_existing_dest(tmp_path: Path) -> None:
+    """A download that fails mid-stream leaves dest untouched and no .part file."""
+    def failing_chunks():
+        yield b"partial"
+        raise httpx.ReadError("connection reset")
+
+    r = MagicMock()
+    r.raise_for_status = MagicMock()
+    r.iter_bytes = MagicMock(return_value=failing_chunks())
+    cm = MagicMock()
+    cm.__enter__ = MagicMock(return_value=r)
+    cm.__exit__ = MagicMock(return_value=False)
+    mock_client = MagicMock()
+    mock_client.stream.return_value = cm
+
+    dest = tmp_path / "file.zip"
+    dest.write_bytes(b"previous")
+    with pytest.raises(httpx.ReadError):
+        stream_download(mock_client, "https://example.com/file.zip", dest)
+    assert dest.read_bytes() == b"previous"
+    assert not (tmp_path / "file.zip.part").exists()
+
+
 def test_iom_duplicate_filenames_disambiguated(tmp_raw: Path) -> None:
     """Two PDFs with the same URL path segment get disambiguated (e.g. document.pdf, document_1.pdf)."""
     index_html = """
@@ -125,6 +125,15 @@ class TestApplySynonyms:
         assert "benefits" in result.lower()
         assert "reimbursement" in result.lower()
 
+    def test_uses_cached_domain_scanner(self):
+        from insurance_rag.config import DEFAULT_DOMAIN
+        from insurance_rag.domains import get_domain
+
+        scanner = get_domain(DEFAULT_DOMAIN).synonym_scanner
+        with patch.object(scanner, "expansions", return_value=["extra"]) as mock_expansions:
+            assert _apply_synonyms("some query") == "some query extra"
+        mock_expansions.assert_called_once_with("some query")
+
 
 # ---------------------------------------------------------------------------
 # BM25Index
@@ -42,6 +42,27 @@ def test_meta_schema() -> None:
     assert meta2["hcpcs_code"] == "A1001"
 
 
+def test_write_doc_creates_dirs_and_truncates(tmp_path: Path) -> None:
+    txt_path, meta_path = extract._write_doc(
+        tmp_path, "codes/hcpcs", "A1001", "a much longer first text", {"source": "codes"}
+    )
+    assert txt_path == tmp_path / "codes" / "hcpcs" / "A1001.txt"
+    extract._write_doc(tmp_path, "codes/hcpcs", "A1001", "short", {"source": "codes"})
+    assert txt_path.read_text(encoding="utf-8") == "short"
+    assert json.loads(meta_path.read_text()) == {"source": "codes"}
+    assert not list(txt_path.parent.glob("*.part"))
+
+
+def test_write_bytes_failure_keeps_previous_file(tmp_path: Path) -> None:
+    path = tmp_path / "A1001.txt"
+    extract._write_bytes(path, b"old")
+    with patch.object(extract.os, "write", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            extract._write_bytes(path, b"new")
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["A1001.txt"]
+
+
 def test_is_mcd_long_text_key() -> None:
     assert _is_mcd_long_text_key("Body") is True
     assert _is_mcd_long_text_key("policy_text") is True
@@ -61,6 +82,38 @@ def test_html_to_text() -> None:
     assert _html_to_text("") == ""
 
 
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<p>Hello</p>",
+        "<div><b>Foo</b> bar</div>",
+        "<p>a &amp; b&nbsp;</p><ul><li>one</li><li>two</li></ul>",
+        "<p>x<br>y<br/>z</p>",
+    ],
+)
+def test_simple_html_fast_path_matches_soup(html: str) -> None:
+    fast = extract._simple_html_to_text(html)
+    assert fast is not None
+    with patch.object(extract, "_simple_html_to_text", return_value=None):
+        assert fast == _html_to_text(html)
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<table><tr><td>A</td></tr></table>",
+        "<p>x</p><!-- note -->",
+        '<a href="x">y</a>',
+        "<p>a < b</p>",
+        "<b>unclosed",
+        "<p>AT&T</p>",
+        "<p>" + "x" * 3000 + "</p>",
+    ],
+)
+def test_simple_html_fast_path_defers_to_soup(html: str) -> None:
+    assert extract._simple_html_to_text(html) is None
+
+
 def test_html_to_text_preserves_tables_as_pipe_delimited() -> None:
     """HTML tables are converted to pipe-delimited rows for LCD coverage criteria."""
     html = (
@@ -77,6 +130,7 @@ def test_html_to_text_preserves_tables_as_pipe_delimited() -> None:
     lines = [line.strip() for line in result.splitlines() if line.strip()]
     assert len(lines) >= 2
     assert any("G0008" in line and "COVID admin" in line for line in lines)
+    assert _html_to_text(html.upper().replace("<TABLE", "<Table")) == result.upper()
 
 
 def test_cell_to_text_html_empty_returns_none() -> None:
@@ -139,6 +193,8 @@ def test_format_date_yyyymmdd() -> None:
     assert _format_date_yyyymmdd("20020701") == "2002-07-01"
     assert _format_date_yyyymmdd("") is None
     assert _format_date_yyyymmdd("123") is None
+    assert _format_date_yyyymmdd("2002O701") is None
+    assert _format_date_yyyymmdd("        ") is None
 
 
 def test_parse_hcpcs_line() -> None:
@@ -160,6 +216,50 @@ def test_parse_hcpcs_line() -> None:
     assert rec["ric"] == "7"
     assert "Dressing" in rec["long_desc"]
     assert rec["effective_date"] == "20020701"
+    # RICs the extractor never uses are rejected before any column is sliced.
+    assert _parse_hcpcs_line(line[:10] + "5" + line[11:]) is None
+
+
+def _hcpcs_line(code: str, ric: str, long_desc: str) -> str:
+    return (
+        code.ljust(5) + "00100" + ric + long_desc.ljust(80) + "Short".ljust(28)
+        + " " * (277 - 120) + "20020701" + "20020701" + " " * (320 - 292)
+    )
+
+
+def test_iter_hcpcs_records_merges_continuations() -> None:
+    lines = [
+        _hcpcs_line("A1000", "4", "orphan continuation"),
+        _hcpcs_line("A1001", "3", "Dressing"),
+        _hcpcs_line("A1001", "4", "continued"),
+        "too short",
+        _hcpcs_line("A1002", "7", "Modifier"),
+        _hcpcs_line("A1004", "3", "Last"),
+    ]
+    records = list(extract._iter_hcpcs_records(lines))
+    assert [r["code"] for r in records] == ["A1001", "A1002", "A1004"]
+    assert records[0]["long_desc"] == "Dressing continued"
+    assert records[1]["ric"] == "7"
+
+
+def test_read_hcpcs_lines_crlf(tmp_path: Path) -> None:
+    """CRLF endings are stripped before the length rule, so a 119-char line stays too short."""
+    path = tmp_path / "HCPC_sample.txt"
+    lines = [
+        _hcpcs_line("A1000", "5", "unused"),
+        _hcpcs_line("A1001", "3", "Dressing"),
+        _hcpcs_line("A1001", "4", "continued"),
+        _hcpcs_line("A1002", "3", "Short line")[:119],
+        _hcpcs_line("A1004", "7", "Modifier"),
+    ]
+    path.write_bytes("\r\n".join(lines).encode() + b"\r\n")
+    read = extract._read_hcpcs_lines(path)
+    assert read == lines
+    records = list(extract._iter_hcpcs_records(read))
+    assert [r["code"] for r in records] == ["A1001", "A1004"]
+    assert records[0]["long_desc"] == "Dressing continued"
+    (tmp_path / "empty.txt").write_bytes(b"")
+    assert extract._read_hcpcs_lines(tmp_path / "empty.txt") == []
 
 
 # --- IOM extraction (mocked PDF) ---
@@ -169,23 +269,16 @@ def test_parse_hcpcs_line() -> None:
 def tmp_iom_raw(tmp_path: Path) -> Path:
     raw = tmp_path / "raw" / "iom"
     (raw / "100-02").mkdir(parents=True)
-    # Create a minimal file so the path exists; we mock pdfplumber
+    # Create a minimal file so the path exists; tests supply the page text
     (raw / "100-02" / "bp102c06.pdf").write_bytes(b"%PDF-1.4 minimal")
     return tmp_path / "raw"
 
 
 def test_extract_iom_writes_txt_and_meta(tmp_iom_raw: Path, tmp_path: Path) -> None:
     processed = tmp_path / "processed"
-    mock_pdf = MagicMock()
-    mock_page = MagicMock()
-    mock_page.extract_text.return_value = "Chapter 6 content here."
-    mock_pdf.pages = [mock_page]
-    mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-    mock_pdf.__exit__ = MagicMock(return_value=False)
-
-    with patch("insurance_rag.ingest.extract.pdfplumber") as mock_plumber:
-        mock_plumber.open.return_value = mock_pdf
-        written = extract_iom(processed, tmp_iom_raw, force=True)
+    written = extract_iom(
+        processed, tmp_iom_raw, force=True, pdf_text_fn=lambda p: ["Chapter 6 content here."]
+    )
 
     assert len(written) == 1
     txt_path, meta_path = written[0]
@@ -198,6 +291,137 @@ def test_extract_iom_writes_txt_and_meta(tmp_iom_raw: Path, tmp_path: Path) -> N
     assert meta["chapter"] == "6"
 
 
+def test_pdf_page_texts_pdfplumber_fallback(tmp_iom_raw: Path) -> None:
+    """Unreadable by PDFium (or without it), pages come from pdfplumber and are then closed."""
+    mock_pdf = MagicMock()
+    mock_page = MagicMock()
+    mock_page.extract_text.return_value = " Chapter 6 content here. "
+    blank_page = MagicMock()
+    blank_page.extract_text.return_value = None
+    mock_pdf.pages = [mock_page, blank_page]
+    mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
+    mock_pdf.__exit__ = MagicMock(return_value=False)
+
+    with patch("insurance_rag.ingest.extract.pdfplumber") as mock_plumber:
+        mock_plumber.open.return_value = mock_pdf
+        pages = extract._pdf_page_texts(tmp_iom_raw / "iom" / "100-02" / "bp102c06.pdf")
+
+    assert pages == ["Chapter 6 content here.", ""]
+    mock_plumber.open.assert_called_once()
+    mock_page.close.assert_called_once()
+
+
+def test_pdf_page_texts_flushes_pages_without_close(tmp_iom_raw: Path) -> None:
+    """pdfplumber 0.10 pages have no close(); their cache is flushed instead."""
+    page = MagicMock(spec=["extract_text", "flush_cache"])
+    page.extract_text.return_value = "Chapter 6."
+    mock_pdf = MagicMock()
+    mock_pdf.pages = [page]
+    mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
+    mock_pdf.__exit__ = MagicMock(return_value=False)
+
+    with patch("insurance_rag.ingest.extract.pdfplumber") as mock_plumber:
+        mock_plumber.open.return_value = mock_pdf
+        pages = extract._pdf_page_texts(tmp_iom_raw / "iom" / "100-02" / "bp102c06.pdf")
+
+    assert pages == ["Chapter 6."]
+    page.flush_cache.assert_called_once()
+
+    # Builds with close() but no flush_cache() must not touch flush_cache at all.
+    page = MagicMock(spec=["extract_text", "close"])
+    page.extract_text.return_value = "Chapter 6."
+    mock_pdf.pages = [page]
+    with patch("insurance_rag.ingest.extract.pdfplumber") as mock_plumber:
+        mock_plumber.open.return_value = mock_pdf
+        assert extract._pdf_page_texts(tmp_iom_raw / "iom" / "100-02" / "bp102c06.pdf") == [
+            "Chapter 6."
+        ]
+    page.close.assert_called_once()
+
+
+def test_extract_iom_skips_unchanged_source(tmp_iom_raw: Path, tmp_path: Path) -> None:
+    """Without force, a chapter is re-extracted only when its PDF's SHA-256 changes."""
+    processed = tmp_path / "processed"
+    pdf_path = tmp_iom_raw / "iom" / "100-02" / "bp102c06.pdf"
+    with patch.object(extract, "_extract_iom_pdf", return_value="Chapter 6.") as mock_extract:
+        written = extract_iom(processed, tmp_iom_raw, force=False)
+        meta = json.loads(written[0][1].read_text())
+        assert len(meta["src_sha256"]) == 64
+
+        assert extract_iom(processed, tmp_iom_raw, force=False) == written
+        assert mock_extract.call_count == 1
+
+        pdf_path.write_bytes(b"%PDF-1.4 revised")
+        extract_iom(processed, tmp_iom_raw, force=False)
+        assert mock_extract.call_count == 2
+
+
+def test_extract_iom_skips_unreadable_source(tmp_iom_raw: Path, tmp_path: Path) -> None:
+    """A PDF that cannot be hashed is logged and skipped; the other chapters still extract."""
+    manual_dir = tmp_iom_raw / "iom" / "100-02"
+    (manual_dir / "bp102c07.pdf").write_bytes(b"%PDF-1.4 minimal")
+    real_sha256 = extract.file_sha256
+
+    def flaky_sha256(path: Path) -> str:
+        if path.name == "bp102c06.pdf":
+            raise PermissionError("denied")
+        return real_sha256(path)
+
+    with patch.object(extract, "file_sha256", side_effect=flaky_sha256):
+        written = extract_iom(
+            tmp_path / "processed", tmp_iom_raw, force=True, pdf_text_fn=lambda p: ["Chapter 7."]
+        )
+    assert [p.name for p, _ in written] == ["ch7.txt"]
+
+
+def test_extract_iom_pdf_uses_pdfium(tmp_path: Path, minimal_pdf) -> None:
+    """With pypdfium2 installed, readable IOM PDFs are extracted without pdfplumber."""
+    pytest.importorskip("pypdfium2")
+    pdf_path = tmp_path / "bp102c06.pdf"
+    pdf_path.write_bytes(minimal_pdf("Chapter 6 content here."))
+    with patch("insurance_rag.ingest.extract.pdfplumber") as mock_plumber, patch(
+        "insurance_rag.ingest.extract._extract_pdf_page_unstructured", return_value=""
+    ):
+        text = extract._extract_iom_pdf(pdf_path, "100-02", "6")
+    assert text == "Chapter 6 content here."
+    mock_plumber.open.assert_not_called()
+
+
+def test_extract_iom_process_pool(
+    tmp_path: Path, minimal_pdf, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With EXTRACT_WORKERS > 1, IOM PDFs are read in worker processes; output order is stable."""
+    monkeypatch.setattr(extract, "EXTRACT_WORKERS", 2)
+    raw = tmp_path / "raw"
+    manual_dir = raw / "iom" / "100-02"
+    manual_dir.mkdir(parents=True)
+    for ch in ("03", "01", "02"):
+        (manual_dir / f"bp102c{ch}.pdf").write_bytes(minimal_pdf(f"Chapter {ch} text"))
+
+    written = extract_iom(tmp_path / "processed", raw, force=True)
+
+    assert [p.name for p, _ in written] == ["ch1.txt", "ch2.txt", "ch3.txt"]
+    assert "Chapter 02 text" in written[1][0].read_text()
+
+
+def test_extract_iom_unpicklable_pdf_text_fn_runs_serially(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An injected lambda cannot go to worker processes, so it is run in-process."""
+    monkeypatch.setattr(extract, "EXTRACT_WORKERS", 2)
+    raw = tmp_path / "raw"
+    manual_dir = raw / "iom" / "100-02"
+    manual_dir.mkdir(parents=True)
+    for ch in ("01", "02"):
+        (manual_dir / f"bp102c{ch}.pdf").write_bytes(b"%PDF-1.4 " + ch.encode())
+
+    written = extract_iom(
+        tmp_path / "processed", raw, force=True, pdf_text_fn=lambda p: [f"Text of {p.stem}"]
+    )
+
+    assert [p.read_text() for p, _ in written] == ["Text of bp102c01", "Text of bp102c02"]
+
+
 # --- MCD extraction (CSV with HTML) ---
 
 
@@ -238,6 +462,29 @@ def test_extract_mcd_writes_txt_and_meta(tmp_mcd_raw: Path, tmp_path: Path) -> N
     assert meta.get("lcd_id") or "L12345" in str(meta.get("doc_id", ""))
 
 
+def test_extract_mcd_row_columns(tmp_path: Path) -> None:
+    """Blank lines are skipped, short rows are tolerated, and meta falls back across columns."""
+    raw = tmp_path / "raw"
+    mcd = raw / "mcd" / "current_lcd"
+    mcd.mkdir(parents=True)
+    (mcd / "LCD.csv").write_text(
+        "LCD_ID,LCDTitle,Contractor,Body\n"
+        "L1,First title,Noridian,<p>First body</p>\n"
+        "\n"
+        "L2,Second title\n",
+        encoding="utf-8",
+    )
+
+    written = extract_mcd(tmp_path / "processed", raw, force=True)
+
+    assert [p.name for p, _ in written] == ["L1.txt", "L2.txt"]
+    meta = json.loads(written[0][1].read_text())
+    assert meta["title"] == "First title"
+    assert meta["jurisdiction"] == "Noridian"
+    assert "First body" in written[0][0].read_text()
+    assert json.loads(written[1][1].read_text())["jurisdiction"] is None
+
+
 def test_extract_mcd_handles_large_csv_fields(tmp_path: Path) -> None:
     """MCD LCD.csv contains very large policy text fields; extractor should not skip them."""
     raw = tmp_path / "raw"
@@ -317,6 +564,17 @@ def test_extract_hcpcs_writes_txt_and_meta(tmp_hcpcs_raw: Path, tmp_path: Path)
     assert meta.get("hcpcs_code") == "A1001"
 
 
+def test_extract_hcpcs_skips_existing_outputs(tmp_hcpcs_raw: Path, tmp_path: Path) -> None:
+    processed = tmp_path / "processed"
+    written = extract_hcpcs(processed, tmp_hcpcs_raw, force=False)
+    with patch.object(extract, "_write_doc") as mock_write:
+        assert extract_hcpcs(processed, tmp_hcpcs_raw, force=False) == written
+    mock_write.assert_not_called()
+    written[0][1].unlink()
+    assert extract_hcpcs(processed, tmp_hcpcs_raw, force=False) == written
+    assert written[0][1].exists()
+
+
 # --- extract_all ---
 
 
@@ -415,6 +673,31 @@ def test_chunk_documents_attaches_metadata(tmp_path: Path) -> None:
         assert "total_chunks" in d.metadata
 
 
+def test_chunk_documents_reuses_splitters(tmp_path: Path) -> None:
+    """Splitters are built once per (size, overlap), not per document or per call."""
+    from insurance_rag.domains import get_domain
+    from insurance_rag.ingest import chunk
+
+    regs = tmp_path / "regulations" / "naic"
+    regs.mkdir(parents=True)
+    for name in ("mo-710", "mo-725"):
+        (regs / f"{name}.txt").write_text("Model law text. " * 200)
+        (regs / f"{name}.meta.json").write_text('{"source": "regulations"}')
+
+    chunk._get_splitter.cache_clear()
+    docs = chunk_documents(
+        tmp_path, source="regulations", domain=get_domain("auto"), enable_summaries=False
+    )
+    built = chunk._get_splitter.cache_info().misses
+    assert built <= 3  # standard, LCD defaults, and the auto "regulations" override
+    chunk_documents(
+        tmp_path, source="regulations", domain=get_domain("auto"), enable_summaries=False
+    )
+    assert chunk._get_splitter.cache_info().misses == built
+    # The override's 1500-char chunks apply to regulations.
+    assert max(len(d.page_content) for d in docs) > 1000
+
+
 def test_chunk_documents_code_one_chunk_per_doc(tmp_path: Path) -> None:
     (tmp_path / "codes" / "hcpcs").mkdir(parents=True)
     (tmp_path / "codes" / "hcpcs" / "A1001.txt").write_text("Code: A1001\n\nLong description.\n\nShort.")
@@ -533,6 +816,28 @@ def test_parse_icd10_xml_root_generic_format() -> None:
     assert "A00.1" in codes
 
 
+@pytest.mark.parametrize(
+    "xml_str",
+    [
+        "<t><chapter><name>1</name><desc>Ch</desc><diag><name>A00</name><desc>Cholera</desc>"
+        "<diag><name>A00.0</name><desc>Cholera 01</desc></diag>"
+        "<diag><name>A00.1</name><desc>Cholera eltor</desc></diag></diag>"
+        "<diag><name>A01</name><desc>Typhoid</desc></diag></chapter></t>",
+        "<root><row><code>A00.0</code><desc>Cholera</desc></row>"
+        "<row><codeValue>A00.1</codeValue><description>Eltor</description></row>"
+        "<row><code>not-a-code</code><desc>x</desc></row></root>",
+    ],
+)
+def test_parse_icd10_xml_stream_matches_tree(xml_str: str) -> None:
+    """The streaming parser yields the same pairs, in document order, as the tree parser."""
+    import io
+    import xml.etree.ElementTree as ET
+
+    pairs = extract._parse_icd10_xml_stream(io.BytesIO(xml_str.encode()))
+    assert pairs == _parse_icd10_xml_root(ET.fromstring(xml_str))
+    assert len(pairs) >= 2
+
+
 # --- ICD-10-CM CDC tabular extraction ---
 
 
@@ -1,6 +1,8 @@
 """Tests for retriever and query chain (Phase 4), including LCD-aware retrieval."""
+import asyncio
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.documents import Document
@@ -10,6 +12,7 @@ from insurance_rag.index.store import upsert_documents
 from insurance_rag.query.retriever import (
     LCDAwareRetriever,
     _deduplicate_docs,
+    _get_specialized_source_filter,
     _resolve_domain_name,
     _strip_to_medical_concept,
     expand_lcd_query,
@@ -65,6 +68,30 @@ def test_resolve_domain_name_invalid_falls_back_to_default() -> None:
     assert resolved == DEFAULT_DOMAIN
 
 
+def test_domain_lookups_follow_re_registration() -> None:
+    """Re-registering a domain replaces its cached filter and query patterns."""
+    from insurance_rag.domains import register_domain
+    from insurance_rag.domains.medicare import MedicareDomain
+
+    assert _get_specialized_source_filter("medicare") == {"source": "mcd"}
+
+    class IomFirstMedicare(MedicareDomain):
+        def get_specialized_source_filter(self) -> dict[str, str] | None:
+            return {"source": "iom"}
+
+        def get_query_patterns(self) -> dict:
+            return {}
+
+    register_domain(IomFirstMedicare)
+    try:
+        assert _get_specialized_source_filter("medicare") == {"source": "iom"}
+        assert not is_lcd_query("What is the LCD for cardiac rehab?", "medicare")
+    finally:
+        register_domain(MedicareDomain)
+    assert _get_specialized_source_filter("medicare") == {"source": "mcd"}
+    assert is_lcd_query("What is the LCD for cardiac rehab?", "medicare")
+
+
 def test_get_retriever_invalid_domain_does_not_crash() -> None:
     """get_retriever with invalid domain_name does not raise KeyError."""
     mock_store = MagicMock()
@@ -351,6 +378,29 @@ class TestLCDAwareRetriever:
             "Medicare Part B coverage", k=5
         )
 
+    def test_non_lcd_query_detects_topics_once(self):
+        store = self._make_mock_store()
+        retriever = LCDAwareRetriever(store=store, k=5, lcd_k=12)
+        with patch(
+            "insurance_rag.query.retriever.detect_query_topics", return_value=[]
+        ) as detect:
+            retriever.invoke("Medicare Part B coverage")
+        detect.assert_called_once_with("Medicare Part B coverage", domain_name=None)
+
+    def test_search_cancelled_when_topic_detection_raises(self):
+        retriever = LCDAwareRetriever(store=self._make_mock_store(), k=5, lcd_k=12)
+        executor = MagicMock()
+        with (
+            patch("insurance_rag.query.retriever._SEARCH_EXECUTOR", executor),
+            patch(
+                "insurance_rag.query.retriever.detect_query_topics",
+                side_effect=RuntimeError("boom"),
+            ),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            retriever.invoke("Medicare Part B coverage")
+        executor.submit.return_value.cancel.assert_called_once_with()
+
     def test_lcd_query_runs_multiple_searches(self):
         store = self._make_mock_store()
         retriever = LCDAwareRetriever(store=store, k=5, lcd_k=12)
@@ -399,6 +449,21 @@ class TestLCDAwareRetriever:
         for mc in mcd_calls:
             assert mc.kwargs["filter"]["source"] == "mcd"
 
+    def test_source_filter_computed_once_per_instance(self):
+        store = self._make_mock_store()
+        retriever = LCDAwareRetriever(
+            store=store, k=5, lcd_k=12, metadata_filter={"manual": "100-02"}
+        )
+        assert retriever._source_filter == {"manual": "100-02", "source": "mcd"}
+        retriever.invoke("LCD cardiac rehab coverage")
+        retriever.invoke("LCD wound care coverage")
+        mcd_filters = [
+            c.kwargs["filter"] for c in store.similarity_search.call_args_list
+            if "source" in (c.kwargs.get("filter") or {})
+        ]
+        assert len(mcd_filters) >= 2
+        assert all(f is retriever._source_filter for f in mcd_filters)
+
     def test_lcd_query_with_non_mcd_source_filter_skips_lcd_aware_retrieval(self):
         """When metadata_filter specifies a non-MCD source, LCD-aware retrieval
         is skipped and standard similarity search is used instead."""
@@ -422,6 +487,111 @@ class TestLCDAwareRetriever:
         results = retriever.invoke("LCD cardiac rehab")
         assert len(results) >= 0
 
+    def test_lcd_query_skips_variants_once_lcd_k_saturated(self):
+        """Expanded-variant searches are skipped when the source-filtered and
+        base searches already yield lcd_k unique docs."""
+        counter = iter(range(1000))
+
+        def fresh_docs(query, k, **kwargs):
+            return [self._make_doc(f"doc {i}", f"mcd_{i}") for i in
+                    (next(counter) for _ in range(k))]
+
+        store = MagicMock()
+        store.similarity_search.side_effect = fresh_docs
+        retriever = LCDAwareRetriever(store=store, k=5, lcd_k=8)
+        results = retriever.invoke("Does Novitas (JL) have an LCD for cardiac rehab?")
+        assert len(results) == 8
+        assert store.similarity_search.call_count == 2
+        filters = [c.kwargs.get("filter") for c in store.similarity_search.call_args_list]
+        assert filters == [{"source": "mcd"}, None]
+        # Round-robin merge keeps source-filtered and base results interleaved
+        assert [d.metadata["doc_id"] for d in results[:2]] == ["mcd_0", "mcd_4"]
+
+    def _make_async_store(self) -> MagicMock:
+        mock = MagicMock()
+        mock.asimilarity_search = AsyncMock(return_value=[
+            self._make_doc("LCD cardiac rehab coverage criteria", "mcd_lcd_123"),
+        ])
+        return mock
+
+    def test_ainvoke_non_lcd_query_uses_async_search(self):
+        store = self._make_async_store()
+        retriever = LCDAwareRetriever(store=store, k=5, lcd_k=12)
+        results = asyncio.run(retriever.ainvoke("Medicare Part B coverage"))
+        assert len(results) == 1
+        store.asimilarity_search.assert_awaited_once_with("Medicare Part B coverage", k=5)
+        store.similarity_search.assert_not_called()
+
+    def test_ainvoke_detects_topics_while_searching(self):
+        searching = threading.Event()
+        store = MagicMock()
+
+        async def search(query, **kwargs):
+            searching.set()
+            await asyncio.sleep(0.05)
+            return [self._make_doc("Part B coverage", "iom_1")]
+
+        store.asimilarity_search = search
+
+        def detect(query, **kwargs):
+            # Only overlaps if the search has started while topics are detected.
+            assert searching.wait(timeout=5)
+            return []
+
+        retriever = LCDAwareRetriever(store=store, k=5, lcd_k=12)
+        with patch("insurance_rag.query.retriever.detect_query_topics", side_effect=detect):
+            results = asyncio.run(retriever.ainvoke("Medicare Part B coverage"))
+        assert len(results) == 1
+
+    def test_ainvoke_lcd_query_matches_sync_searches(self):
+        query = "Does Novitas (JL) have an LCD for cardiac rehab?"
+        sync_store = self._make_mock_store()
+        LCDAwareRetriever(store=sync_store, k=5, lcd_k=12).invoke(query)
+
+        async_store = self._make_async_store()
+        retriever = LCDAwareRetriever(store=async_store, k=5, lcd_k=12)
+        results = asyncio.run(retriever.ainvoke(query))
+
+        assert len(results) == 1
+        assert sorted(map(str, async_store.asimilarity_search.call_args_list)) == sorted(
+            map(str, sync_store.similarity_search.call_args_list)
+        )
+        async_store.similarity_search.assert_not_called()
+
+    def test_ainvoke_lcd_query_merges_like_sync(self):
+        """With several distinct docs per search, ainvoke applies the same lcd_k
+        cutoff as invoke and returns the same docs in the same order."""
+        query = "Does Novitas (JL) have an LCD for cardiac rehab?"
+
+        def docs_for(query, k, filter=None):
+            return [self._make_doc(f"{query} {i}", f"{query}|{filter}|{i}") for i in range(k)]
+
+        async def adocs_for(query, **kwargs):
+            return docs_for(query, **kwargs)
+
+        store = MagicMock()
+        store.similarity_search.side_effect = docs_for
+        store.asimilarity_search = AsyncMock(side_effect=adocs_for)
+        with patch("insurance_rag.query.retriever.detect_query_topics", return_value=[]):
+            for lcd_k in (8, 12, 40):
+                retriever = LCDAwareRetriever(store=store, k=5, lcd_k=lcd_k)
+                sync_ids = [d.metadata["doc_id"] for d in retriever.invoke(query)]
+                async_ids = [
+                    d.metadata["doc_id"] for d in asyncio.run(retriever.ainvoke(query))
+                ]
+                assert async_ids == sync_ids
+                assert 0 < len(sync_ids) <= lcd_k
+
+    def test_ainvoke_lcd_query_with_non_mcd_source_filter(self):
+        store = self._make_async_store()
+        retriever = LCDAwareRetriever(
+            store=store, k=5, lcd_k=12, metadata_filter={"source": "iom"}
+        )
+        asyncio.run(retriever.ainvoke("LCD cardiac rehab coverage"))
+        store.asimilarity_search.assert_awaited_once_with(
+            "LCD cardiac rehab coverage", k=5, filter={"source": "iom"}
+        )
+
 
 def test_run_eval_returns_metrics_for_one_question(tmp_path: Path) -> None:
     """Phase 5: retrieval eval path run_eval returns expected metrics structure."""
@@ -5,6 +5,8 @@ from langchain_core.documents import Document
 
 from insurance_rag.query.retriever import (
     LCDAwareRetriever,
+    _merge_round_robin,
+    _metadata_view,
     boost_summaries,
     detect_query_topics,
     inject_topic_summaries,
@@ -124,6 +126,33 @@ class TestBoostSummaries:
         )
 
 
+class TestMetadataView:
+
+    def test_extracts_fields_with_defaults(self):
+        docs = [
+            _doc("a", doc_id="d1", chunk=3),
+            Document(page_content="b", metadata={
+                "doc_id": "topic_x", "doc_type": "topic_summary", "topic_cluster": "x",
+            }),
+        ]
+        view = _metadata_view(docs)
+        assert view.doc_ids == ["d1", "topic_x"]
+        assert view.chunk_indices == [3, 0]
+        assert view.doc_types == ["", "topic_summary"]
+        assert view.topic_clusters == ["", "x"]
+        assert view.topic_clusters_multi == [frozenset(), frozenset()]
+
+    def test_merge_round_robin_keeps_view_aligned(self):
+        list1 = [_doc("A", doc_id="d1"), _doc("B", doc_id="d2")]
+        list2 = [_doc("A dup", doc_id="d1"), _doc("C", doc_id="d3", doc_type="topic_summary")]
+        merged, view = _merge_round_robin(
+            [list1, list2], [_metadata_view(list1), _metadata_view(list2)], max_k=10
+        )
+        assert [d.metadata["doc_id"] for d in merged] == ["d1", "d2", "d3"]
+        assert view.doc_ids == ["d1", "d2", "d3"]
+        assert view.doc_types == ["", "", "topic_summary"]
+
+
 class TestInjectTopicSummaries:
 
     def test_injects_topic_summary_when_topic_exists_and_not_in_docs(self):
@@ -186,6 +215,31 @@ class TestInjectTopicSummaries:
         assert out[1].metadata["doc_id"] == "d1"
         mock_coll.get.assert_called_once()
 
+    def test_existence_check_runs_without_payload(self):
+        mock_store = MagicMock()
+        mock_coll = MagicMock()
+        mock_coll.get.side_effect = [
+            {"ids": ["topic_cardiac_rehab", "topic_imaging"]},
+            {
+                "ids": ["topic_imaging"],
+                "documents": ["Imaging summary."],
+                "metadatas": [{"doc_id": "topic_imaging", "topic_cluster": "imaging"}],
+            },
+        ]
+        mock_store._collection = mock_coll
+
+        existing_summary = _doc(
+            "Topic summary.", doc_id="topic_cardiac_rehab",
+            doc_type="topic_summary", topic_cluster="cardiac_rehab",
+        )
+        out = inject_topic_summaries(
+            mock_store, [existing_summary], ["cardiac_rehab", "imaging"], max_k=10
+        )
+        assert [d.metadata["doc_id"] for d in out] == ["topic_imaging", "topic_cardiac_rehab"]
+        first, second = mock_coll.get.call_args_list
+        assert first.kwargs == {"ids": ["topic_cardiac_rehab", "topic_imaging"], "include": []}
+        assert second.kwargs == {"ids": ["topic_imaging"], "include": ["documents", "metadatas"]}
+
     def test_empty_topics_returns_docs_unchanged(self):
         mock_store = MagicMock()
         docs = [_doc("content", doc_id="d1")]